@@ -0,0 +1,40 @@
+"""Compatibility helpers for Python versions and optional dependencies."""
+
+import json
+import sys
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+# Keyword arguments enabling ``__slots__`` on dataclasses where supported.
+# ``dataclass(slots=True)`` exists from Python 3.10; older interpreters
+# fall back to regular dataclasses with an instance ``__dict__``.
+DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+# JSON decoder for API responses: orjson when installed (the ``fast`` extra),
+# otherwise the standard library. Both accept the raw response bytes.
+try:
+    import orjson
+
+    json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # pragma: no cover - depends on the environment
+    json_loads = json.loads
+
+# datetime.fromisoformat parses a trailing 'Z' as UTC from Python 3.11
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp as emitted by the GitHub API.
+
+    Args:
+        value: Timestamp such as '2024-01-15T10:00:00Z'.
+
+    Returns:
+        Parsed datetime; aware (UTC) for GitHub's 'Z'-suffixed values.
+    """
+    # Older interpreters need GitHub's 'Z' suffix as an explicit offset
+    if not _FROMISOFORMAT_ACCEPTS_Z and value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
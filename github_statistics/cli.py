@@ -2,17 +2,35 @@
 Command-line interface for github_statistics.
 """
 
-import argparse
 import os
+import re
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional
 
-from github_statistics.config import Config, ConfigValidationError, load_config
+from github_statistics._compat import DATACLASS_SLOTS
 
+if TYPE_CHECKING:
+    from github_statistics.config import Config
 
-@dataclass
+_UTC = timezone.utc
+
+# Documented plain-date form of --since/--until, parsed without
+# fromisoformat; every other value is left to fromisoformat
+_ISO_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+
+# Separator for comma-separated CLI lists, absorbing surrounding whitespace
+_LIST_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+def _split_cli_list(value: str) -> List[str]:
+    """Split a comma-separated CLI value into stripped entries."""
+    return _LIST_SEPARATOR.split(value.strip())
+
+
+@dataclass(**DATACLASS_SLOTS)
 class RunOptions:
     """
     Runtime options combining configuration and CLI arguments.
@@ -27,11 +45,12 @@ class RunOptions:
         max_workers: Maximum number of concurrent workers.
         verbose: Whether verbose request logging is enabled.
         request_log_path: Path to the request log file if verbose is enabled.
+        http_cache_path: Path to the persistent HTTP cache file, if enabled.
         overwrite_data_protection: Whether override flag is set.
         data_protection_override_used: Whether override was confirmed and used.
     """
 
-    config: Config
+    config: "Config"
     since: Optional[datetime]
     until: Optional[datetime]
     repositories: List[str]
@@ -40,6 +59,7 @@ class RunOptions:
     max_workers: int
     verbose: bool = False
     request_log_path: Optional[str] = None
+    http_cache_path: Optional[str] = None
     overwrite_data_protection: bool = False
     data_protection_override_used: bool = False
 
@@ -47,6 +67,14 @@ class RunOptions:
     def _parse_cli_datetime(value: str, flag_name: str) -> datetime:
         """Parse CLI datetime and normalize to timezone-aware UTC."""
         try:
+            # Fast path for the documented plain-date form YYYY-MM-DD
+            if _ISO_DATE_PATTERN.fullmatch(value):
+                return datetime(
+                    int(value[:4]),
+                    int(value[5:7]),
+                    int(value[8:]),
+                    tzinfo=_UTC,
+                )
             parsed = datetime.fromisoformat(value)
         except ValueError as e:
             raise ValueError(
@@ -54,12 +82,12 @@ class RunOptions:
             ) from e
 
         if parsed.tzinfo is None:
-            return parsed.replace(tzinfo=timezone.utc)
+            return parsed.replace(tzinfo=_UTC)
 
-        return parsed.astimezone(timezone.utc)
+        return parsed.astimezone(_UTC)
 
     @staticmethod
-    def from_config_and_args(config: Config, args) -> "RunOptions":
+    def from_config_and_args(config: "Config", args) -> "RunOptions":
         """
         Create RunOptions from a Config object and parsed CLI arguments.
 
@@ -87,7 +115,7 @@ class RunOptions:
         # CLI --repos narrows the config repositories (intersection)
         repositories = config.repositories
         if args.repos:
-            cli_repos = [repo.strip() for repo in args.repos.split(",")]
+            cli_repos = set(_split_cli_list(args.repos))
             # Keep only repos that are in both config and CLI filter
             repositories = [
                 repo for repo in config.repositories if repo in cli_repos
@@ -97,13 +125,13 @@ class RunOptions:
         # CLI --users overrides config users
         users = config.users
         if args.users:
-            users = [user.strip() for user in args.users.split(",")]
+            users = _split_cli_list(args.users)
 
         # Determine output filename
-        config_dir = os.path.dirname(os.path.abspath(args.config_path))
-        config_basename = os.path.splitext(os.path.basename(args.config_path))[
-            0
-        ]
+        config_dir, config_filename = os.path.split(
+            os.path.abspath(args.config_path)
+        )
+        config_basename = os.path.splitext(config_filename)[0]
         output = args.output
         if output is None:
             # Default: <config_basename>_statistics.md in same dir as config
@@ -116,6 +144,11 @@ class RunOptions:
             request_log_path = os.path.join(
                 config_dir, f"{config_basename}_requests.log"
             )
+        http_cache_path = None
+        if args.http_cache:
+            http_cache_path = os.path.join(
+                config_dir, f"{config_basename}_http_cache.json"
+            )
         overwrite_data_protection = args.overwrite_data_protection
 
         return RunOptions(
@@ -128,20 +161,23 @@ class RunOptions:
             max_workers=args.max_workers,
             verbose=verbose,
             request_log_path=request_log_path,
+            http_cache_path=http_cache_path,
             overwrite_data_protection=overwrite_data_protection,
         )
 
 
-def parse_arguments(args: List[str]):
+@lru_cache(maxsize=1)
+def _build_parser():
     """
-    Parse command-line arguments.
+    Build the argument parser for the CLI.
 
-    Args:
-        args: List of argument strings (typically sys.argv[1:]).
+    The parser is built once and reused by subsequent calls.
 
     Returns:
-        Parsed arguments namespace.
+        Configured argparse.ArgumentParser instance.
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="github_statistics",
         description="Compute pull request statistics from GitHub Enterprise.",
@@ -192,6 +228,14 @@ def parse_arguments(args: List[str]):
         action="store_true",
         help="Log all GitHub API requests to <config_basename>_requests.log",
     )
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help=(
+            "Reuse unchanged GitHub API responses across runs via "
+            "conditional requests, cached in <config_basename>_http_cache.json"
+        ),
+    )
     parser.add_argument(
         "--overwrite-data-protection",
         action="store_true",
@@ -201,7 +245,20 @@ def parse_arguments(args: List[str]):
         ),
     )
 
-    return parser.parse_args(args)
+    return parser
+
+
+def parse_arguments(args: List[str]):
+    """
+    Parse command-line arguments.
+
+    Args:
+        args: List of argument strings (typically sys.argv[1:]).
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    return _build_parser().parse_args(args)
 
 
 def main():
@@ -214,6 +271,10 @@ def main():
         # Parse command-line arguments
         args = parse_arguments(sys.argv[1:])
 
+        # Deferred so that --help and argument errors exit before PyYAML
+        # and the config validators are imported.
+        from github_statistics.config import ConfigValidationError, load_config
+
         # Load configuration
         try:
             config = load_config(args.config_path)
@@ -248,6 +309,8 @@ def main():
         print(f"  Max workers: {options.max_workers}")
         if options.verbose and options.request_log_path:
             print(f"  Request log: {options.request_log_path}")
+        if options.http_cache_path:
+            print(f"  HTTP cache: {options.http_cache_path}")
         print()
 
         # Import modules (deferred to avoid import errors in early steps)
@@ -269,6 +332,7 @@ def main():
                     token=config.github_api_token,
                     verify_ssl=config.github_verify_ssl,
                     request_log_path=options.request_log_path,
+                    cache_path=options.http_cache_path,
                 )
             else:
                 client = HttpGitHubClient.from_env(
@@ -276,6 +340,7 @@ def main():
                     token_env=config.github_token_env,
                     verify_ssl=config.github_verify_ssl,
                     request_log_path=options.request_log_path,
+                    cache_path=options.http_cache_path,
                 )
         except ValueError as e:
             print(
@@ -296,6 +361,15 @@ def main():
             )
             return 1
 
+        # A cache that cannot be written only costs the next run requests
+        try:
+            client.save_cache()
+        except OSError as e:
+            print(
+                f"Warning: Failed to write HTTP cache: {e}",
+                file=sys.stderr,
+            )
+
         # Enforce data-protection policy
         data_protection_result = evaluate_data_protection_thresholds(
             pull_requests=pull_requests,
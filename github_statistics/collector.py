@@ -2,9 +2,14 @@
 Data collection logic - assembling complete PR objects from the GitHub client.
 """
 
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from functools import lru_cache, partial
+from typing import Deque, Iterator, List
 
+from github_statistics._compat import parse_iso_datetime
 from github_statistics.models import (
     CommentInfo,
     CommitInfo,
@@ -15,19 +20,20 @@ from github_statistics.models import (
 )
 
 
+@lru_cache(maxsize=8192)
 def _parse_iso_datetime(dt_string: str) -> datetime:
     """Parse ISO format datetime string to datetime object.
 
+    Results are cached: timestamps repeat frequently across commits,
+    comments and timeline events, and datetimes are immutable.
+
     Args:
         dt_string: ISO format datetime string (e.g., '2026-01-01T10:00:00Z').
 
     Returns:
         Timezone-aware datetime object (UTC).
     """
-    # Replace 'Z' suffix with '+00:00' for proper parsing
-    if dt_string.endswith("Z"):
-        dt_string = dt_string[:-1] + "+00:00"
-    return datetime.fromisoformat(dt_string)
+    return parse_iso_datetime(dt_string)
 
 
 def _assemble_pull_request(
@@ -45,110 +51,116 @@ def _assemble_pull_request(
         Complete PullRequest object with all associated data.
     """
     number = pr_data["number"]
+    # Bound locally: called for every commit, comment, review and event
+    parse = _parse_iso_datetime
+    # Logins recur across PRs and become dict/set keys in the statistics;
+    # interning makes equal names share one object, so lookups match on
+    # identity before falling back to a string comparison.
+    intern = sys.intern
 
     # Parse basic PR information
     title = pr_data["title"]
-    author = pr_data["user"]["login"]
-    created_at = _parse_iso_datetime(pr_data["created_at"])
+    author = intern(pr_data["user"]["login"])
+    created_at = parse(pr_data["created_at"])
     state = pr_data["state"]
 
-    # Fetch PR details to get additions/deletions (not in list response)
-    pr_details = client.get_pull_request_details(owner, repo, number)
+    # The list endpoint usually omits additions/deletions; only fetch the
+    # PR details when the listing did not already provide them.
+    if "additions" in pr_data and "deletions" in pr_data:
+        pr_details = pr_data
+    else:
+        pr_details = client.get_pull_request_details(owner, repo, number)
     additions = pr_details.get("additions", 0)
     deletions = pr_details.get("deletions", 0)
 
     # Parse optional dates
     closed_at = None
     if pr_data.get("closed_at"):
-        closed_at = _parse_iso_datetime(pr_data["closed_at"])
+        closed_at = parse(pr_data["closed_at"])
 
     merged_at = None
     if pr_data.get("merged_at"):
-        merged_at = _parse_iso_datetime(pr_data["merged_at"])
+        merged_at = parse(pr_data["merged_at"])
 
     # Fetch commits
     commits_data = client.get_pull_request_commits(owner, repo, number)
-    commits = []
-    for commit_data in commits_data:
-        commit_info = CommitInfo(
+    commits = [
+        CommitInfo(
             sha=commit_data["sha"],
-            author=commit_data["commit"]["author"]["name"],
-            committed_at=_parse_iso_datetime(
-                commit_data["commit"]["author"]["date"]
-            ),
+            author=intern(commit_data["commit"]["author"]["name"]),
+            committed_at=parse(commit_data["commit"]["author"]["date"]),
             message=commit_data["commit"]["message"],
         )
-        commits.append(commit_info)
+        for commit_data in commits_data
+    ]
 
     # Fetch comments (both issue comments and review comments)
-    comments = []
-
     # Issue comments (general comments on the PR)
     issue_comments_data = client.get_issue_comments(owner, repo, number)
-    for comment_data in issue_comments_data:
-        comment_info = CommentInfo(
-            author=comment_data["user"]["login"],
-            created_at=_parse_iso_datetime(comment_data["created_at"]),
+    issue_comments = [
+        CommentInfo(
+            author=intern(comment_data["user"]["login"]),
+            created_at=parse(comment_data["created_at"]),
             body=comment_data["body"],
         )
-        comments.append(comment_info)
+        for comment_data in issue_comments_data
+    ]
 
     # Review comments (code-specific comments)
     review_comments_data = client.get_pull_request_review_comments(
         owner, repo, number
     )
-    for comment_data in review_comments_data:
-        comment_info = CommentInfo(
-            author=comment_data["user"]["login"],
-            created_at=_parse_iso_datetime(comment_data["created_at"]),
+    review_comments = [
+        CommentInfo(
+            author=intern(comment_data["user"]["login"]),
+            created_at=parse(comment_data["created_at"]),
             body=comment_data["body"],
         )
-        comments.append(comment_info)
+        for comment_data in review_comments_data
+    ]
 
     # Sort comments by created_at
+    comments = issue_comments + review_comments
     comments.sort(key=lambda c: c.created_at)
 
     # Fetch reviews
     reviews_data = client.get_pull_request_reviews(owner, repo, number)
-    reviews = []
-    for review_data in reviews_data:
-        submitted_at_raw = review_data.get("submitted_at")
-        if not submitted_at_raw:
-            # Skip reviews without submitted_at (e.g. PENDING or draft reviews)
-            continue
-        review_event = ReviewEvent(
-            reviewer=review_data["user"]["login"],
-            submitted_at=_parse_iso_datetime(submitted_at_raw),
+    # Skip reviews without submitted_at (e.g. PENDING or draft reviews)
+    reviews = [
+        ReviewEvent(
+            reviewer=intern(review_data["user"]["login"]),
+            submitted_at=parse(review_data["submitted_at"]),
             state=review_data["state"],
         )
-        reviews.append(review_event)
+        for review_data in reviews_data
+        if review_data.get("submitted_at")
+    ]
 
     # Fetch timeline events for review requests and ready-for-review
     timeline_data = client.get_issue_timeline(owner, repo, number)
-    review_requests = []
+    review_requests: List[ReviewRequestEvent] = []
     ready_for_review_at = None
+    add_review_request = review_requests.append
 
     for event_data in timeline_data:
         event_type = event_data.get("event")
 
-        if (
-            event_type == "review_requested"
-            and "requested_reviewer" in event_data
-        ):
-            # Extract requested reviewer
-            requested_reviewer = event_data["requested_reviewer"]["login"]
-            requested_at = _parse_iso_datetime(event_data["created_at"])
-            review_request = ReviewRequestEvent(
-                requested_reviewer=requested_reviewer,
-                requested_at=requested_at,
-            )
-            review_requests.append(review_request)
-
-        elif event_type == "ready_for_review":
+        if event_type == "review_requested":
+            # Team review requests carry requested_team instead
+            requested_reviewer = event_data.get("requested_reviewer")
+            if requested_reviewer is not None:
+                add_review_request(
+                    ReviewRequestEvent(
+                        requested_reviewer=intern(requested_reviewer["login"]),
+                        requested_at=parse(event_data["created_at"]),
+                    )
+                )
+
+        elif event_type == "ready_for_review" and ready_for_review_at is None:
             # Only take the first/earliest ready_for_review event
-            if ready_for_review_at is None:
-                ready_at = _parse_iso_datetime(event_data["created_at"])
-                ready_for_review_at = ReadyForReviewEvent(ready_at=ready_at)
+            ready_for_review_at = ReadyForReviewEvent(
+                ready_at=parse(event_data["created_at"])
+            )
 
     # Assemble the complete PullRequest object
     return PullRequest(
@@ -170,37 +182,69 @@ def _assemble_pull_request(
     )
 
 
-def collect_prs(_config, options, client) -> List[PullRequest]:
-    """Collect pull requests from configured repositories.
+def iter_prs(options, client) -> Iterator[PullRequest]:
+    """Yield assembled pull requests from configured repositories.
+
+    PR assembly is network-bound, so the per-PR detail requests are fanned
+    out over a thread pool sized by ``options.max_workers``. At most
+    ``2 * max_workers`` pull requests are in flight at once; each is yielded,
+    in the order in which the client listed them, before further work is
+    submitted, so memory held by the generator stays bounded by that window.
 
     Args:
-        _config: Configuration object (not currently used, but kept for interface consistency).
         options: Runtime options (filters, date ranges, repositories).
         client: GitHub client instance.
 
-    Returns:
-        List of PullRequest objects assembled from all configured repositories.
+    Yields:
+        PullRequest objects assembled from all configured repositories.
     """
-    all_prs = []
+    max_workers = max(1, options.max_workers)
+    window = 2 * max_workers
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Iterate through repositories
+        for repo_identifier in options.repositories:
+            # Parse owner/repo from identifier
+            parts = repo_identifier.split("/")
+            if len(parts) != 2:
+                # Skip invalid repository identifiers
+                continue
+
+            owner, repo = parts
+
+            assemble = partial(
+                _assemble_pull_request, client=client, owner=owner, repo=repo
+            )
 
-    # Iterate through repositories
-    for repo_identifier in options.repositories:
-        # Parse owner/repo from identifier
-        parts = repo_identifier.split("/")
-        if len(parts) != 2:
-            # Skip invalid repository identifiers
-            continue
+            # Fetch PRs from this repository with date filtering, keeping a
+            # bounded window of assemblies in flight and yielding the oldest
+            # one in listing order whenever the window is full
+            pending: Deque[Future] = deque()
+            for page in client.iter_pull_request_pages(
+                owner, repo, since=options.since, until=options.until
+            ):
+                for pr_data in page:
+                    pending.append(executor.submit(assemble, pr_data))
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
 
-        owner, repo = parts
+            # Drain the remaining assemblies for this repository
+            while pending:
+                yield pending.popleft().result()
 
-        # Fetch PRs from this repository with date filtering
-        pr_list = client.list_pull_requests(
-            owner, repo, since=options.since, until=options.until
-        )
 
-        # Assemble complete PR objects
-        for pr_data in pr_list:
-            pr = _assemble_pull_request(pr_data, client, owner, repo)
-            all_prs.append(pr)
+def collect_prs(_config, options, client) -> List[PullRequest]:
+    """Collect pull requests from configured repositories.
+
+    The statistics and data-protection checks make several passes over the
+    pull requests, so this materializes the stream from ``iter_prs``.
+
+    Args:
+        _config: Configuration object (not currently used, but kept for interface consistency).
+        options: Runtime options (filters, date ranges, repositories).
+        client: GitHub client instance.
 
-    return all_prs
+    Returns:
+        List of PullRequest objects assembled from all configured repositories.
+    """
+    return list(iter_prs(options, client))
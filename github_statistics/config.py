@@ -4,9 +4,13 @@ Configuration loading and validation.
 
 import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
-import yaml
+from github_statistics._compat import DATACLASS_SLOTS
+
+# git@ style URLs: git@github.com:owner/repo.git
+_GIT_SSH_RE = re.compile(r"^git@[^:]+:(.+?)(?:\.git)?$", re.ASCII)
 
 
 class ConfigValidationError(Exception):
@@ -15,7 +19,7 @@ class ConfigValidationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Config:
     """
     Configuration for github_statistics.
@@ -39,6 +43,7 @@ class Config:
     github_token_env: str = "GITHUB_TOKEN"
 
 
+@lru_cache(maxsize=1024)
 def normalize_repository(repo_identifier: str) -> str:
     """
     Normalize a repository identifier to owner/repo format.
@@ -49,6 +54,8 @@ def normalize_repository(repo_identifier: str) -> str:
     - https://github.com/owner/repo/
     - git@github.com:owner/repo.git
 
+    Results are cached, since the same identifiers recur across reloads.
+
     Args:
         repo_identifier: Repository URL or owner/repo string.
 
@@ -58,73 +65,94 @@ def normalize_repository(repo_identifier: str) -> str:
     # Remove trailing slashes
     repo_identifier = repo_identifier.rstrip("/")
 
-    # Handle git@ style URLs: git@github.com:owner/repo.git
-    git_match = re.match(r"^git@[^:]+:(.+?)(?:\.git)?$", repo_identifier)
-    if git_match:
-        return git_match.group(1)
-
-    # Handle HTTPS URLs: https://github.com/owner/repo
-    https_match = re.match(
-        r"^https?://[^/]+/(.+?)(?:\.git)?$", repo_identifier
-    )
-    if https_match:
-        return https_match.group(1)
+    # Plain owner/repo is the common case, so the prefix checks keep it
+    # from doing any further parsing.
+    if repo_identifier.startswith("git@"):
+        # Handle git@ style URLs: git@github.com:owner/repo.git
+        git_match = _GIT_SSH_RE.match(repo_identifier)
+        if git_match:
+            return git_match.group(1)
+    elif repo_identifier.startswith(("https://", "http://")):
+        # Handle HTTPS URLs: https://github.com/owner/repo splits into
+        # ['https:', '', 'github.com', 'owner/repo']
+        parts = repo_identifier.split("/", 3)
+        if len(parts) == 4 and parts[2] and parts[3]:
+            path = parts[3]
+            if path.endswith(".git") and len(path) > 4:
+                return path[:-4]
+            return path
 
     # Already in owner/repo format
     return repo_identifier
 
 
-def load_config(path: str) -> Config:
-    """Load configuration from a YAML file.
+@lru_cache(maxsize=1)
+def _yaml_safe_loader() -> Any:
+    """Return the fastest available safe YAML loader class.
+
+    PyYAML is imported here rather than at module level so that importing
+    this module for Config or normalize_repository does not load it.
+    """
+    try:
+        from yaml import CSafeLoader
+
+        return CSafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader
+
+        return SafeLoader
+
+
+# Marks required keys that are absent from the configuration mapping
+_MISSING = object()
+
+
+def validate_config(data: Any) -> Config:
+    """Validate parsed configuration data and build a Config.
+
+    This is the validation half of ``load_config``, for callers that
+    already hold the configuration as a mapping and would otherwise
+    round-trip it through a YAML file.
 
     Args:
-        path: Path to the configuration YAML file.
+        data: Parsed configuration, as ``yaml.safe_load`` would return it.
 
     Returns:
         Config object with validated and normalized data.
 
     Raises:
-        FileNotFoundError: If the configuration file does not exist.
-        yaml.YAMLError: If the YAML syntax is invalid.
         ConfigValidationError: If required fields are missing or invalid.
     """
-    # Read and parse YAML
-    with open(path) as f:
-        data = yaml.safe_load(f)
-
     if not isinstance(data, dict):
         raise ConfigValidationError(
             "Configuration file must contain a YAML dictionary"
         )
 
     # Validate github section
-    if "github" not in data:
+    github_config = data.get("github", _MISSING)
+    if github_config is _MISSING:
         raise ConfigValidationError(
             "Configuration must contain 'github' section (required)"
         )
-
-    github_config = data["github"]
     if not isinstance(github_config, dict):
         raise ConfigValidationError("'github' section must be a dictionary")
 
     # Validate and extract github.base_url
-    if "base_url" not in github_config:
+    github_base_url = github_config.get("base_url", _MISSING)
+    if github_base_url is _MISSING:
         raise ConfigValidationError("github.base_url is required")
 
-    github_base_url = github_config["base_url"]
-
     # Apply defaults for optional github fields
     github_api_token = github_config.get("api_token")
     github_token_env = github_config.get("token_env", "GITHUB_TOKEN")
     github_verify_ssl = github_config.get("verify_ssl", True)
 
     # Validate repositories
-    if "repositories" not in data:
+    repositories = data.get("repositories", _MISSING)
+    if repositories is _MISSING:
         raise ConfigValidationError(
             "Configuration must contain 'repositories' field (required)"
         )
-
-    repositories = data["repositories"]
     if not isinstance(repositories, list):
         raise ConfigValidationError("'repositories' must be a list")
 
@@ -132,7 +160,7 @@ def load_config(path: str) -> Config:
         raise ConfigValidationError("'repositories' list cannot be empty")
 
     # Normalize repository identifiers
-    normalized_repos = [normalize_repository(repo) for repo in repositories]
+    normalized_repos = list(map(normalize_repository, repositories))
 
     # Handle users (legacy optional list)
     users = data.get("users", [])
@@ -140,10 +168,9 @@ def load_config(path: str) -> Config:
         raise ConfigValidationError("'users' must be a list")
 
     # Handle user groups (mandatory for data-protection policy)
-    if "user_groups" not in data:
+    user_groups = data.get("user_groups", _MISSING)
+    if user_groups is _MISSING:
         raise ConfigValidationError("'user_groups' is required")
-
-    user_groups = data["user_groups"]
     if not isinstance(user_groups, dict):
         raise ConfigValidationError("'user_groups' must be a dictionary")
 
@@ -164,17 +191,18 @@ def load_config(path: str) -> Config:
             raise ConfigValidationError(
                 f"Group '{group_name}' must contain at least 5 members"
             )
-        if len(set(members)) != len(members):
-            raise ConfigValidationError(
-                f"Group '{group_name}' contains duplicate members"
-            )
-        if any(
-            not isinstance(member, str) or not member.strip()
-            for member in members
-        ):
-            raise ConfigValidationError(
-                f"Group '{group_name}' contains invalid member names"
-            )
+        # Validate names and detect duplicates in a single pass
+        seen = set()
+        for member in members:
+            if not isinstance(member, str) or not member.strip():
+                raise ConfigValidationError(
+                    f"Group '{group_name}' contains invalid member names"
+                )
+            if member in seen:
+                raise ConfigValidationError(
+                    f"Group '{group_name}' contains duplicate members"
+                )
+            seen.add(member)
         validated_groups[group_name] = members
 
     return Config(
@@ -186,3 +214,27 @@ def load_config(path: str) -> Config:
         github_api_token=github_api_token,
         github_token_env=github_token_env,
     )
+
+
+def load_config(path: str) -> Config:
+    """Load configuration from a YAML file.
+
+    Args:
+        path: Path to the configuration YAML file.
+
+    Returns:
+        Config object with validated and normalized data.
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist.
+        yaml.YAMLError: If the YAML syntax is invalid.
+        ConfigValidationError: If required fields are missing or invalid.
+    """
+    # Read and parse YAML, streaming from the file into the libyaml
+    # parser when PyYAML was built with it
+    import yaml
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=_yaml_safe_loader())
+
+    return validate_config(data)
@@ -1,12 +1,121 @@
 """GitHub API client abstraction."""
 
+import json
 import os
 import re
+import tempfile
+import threading
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache, partial
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from github_statistics._compat import json_loads, parse_iso_datetime
+
+# One entry of a Link header: <url>; rel="next", <url>; rel="last"
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="([^"]+)"')
+
+# Timeline requires a special media type accept header. Shared across
+# calls; _get_json copies it before adding cache validators.
+_TIMELINE_HEADERS = {
+    "Accept": "application/vnd.github.mockingbird-preview+json"
+}
+
+# Upper bound on concurrent page requests for one paginated endpoint
+_MAX_PAGE_WORKERS = 8
+
+# Keep-alive connections per host: room for the default four collector
+# workers each fetching pages on _MAX_PAGE_WORKERS threads
+_CONNECTION_POOL_SIZE = 32
+
+
+@lru_cache(maxsize=4096)
+def _created_at_timestamp(value: str) -> float:
+    """Return a GitHub ISO 8601 timestamp as POSIX seconds.
+
+    Date filters compare these floats against bounds converted once per
+    call, which is cheaper than comparing aware datetimes. Results are
+    cached: the same PR listings are filtered repeatedly (per page, per
+    call and across date windows).
+
+    Args:
+        value: Timestamp such as '2024-01-15T10:00:00Z'.
+
+    Returns:
+        Seconds since the Unix epoch.
+
+    Raises:
+        TypeError: If the timestamp carries no UTC offset, as
+            ``datetime.timestamp`` would read it as local time.
+    """
+    created_at = parse_iso_datetime(value)
+    if created_at.utcoffset() is None:
+        raise TypeError(
+            f"Pull request created_at must include a UTC offset, got {value}"
+        )
+    return created_at.timestamp()
+
+
+def _bound_timestamp(bound: Optional[datetime]) -> Optional[float]:
+    """Return an optional date filter bound as POSIX seconds.
+
+    ``datetime.timestamp`` would read a naive bound as local time and
+    silently shift the window, so naive bounds are rejected instead.
+
+    Args:
+        bound: Timezone-aware bound, or None for no bound.
+
+    Returns:
+        Seconds since the Unix epoch, or None without a bound.
+
+    Raises:
+        TypeError: If the bound is a naive datetime.
+    """
+    if bound is None:
+        return None
+    if bound.utcoffset() is None:
+        raise TypeError(
+            f"Date filter bound must be timezone-aware, got naive {bound}"
+        )
+    return bound.timestamp()
+
+
+def _is_cache_entry(entry: Any) -> bool:
+    """Return whether a loaded HTTP cache entry has the expected shape.
+
+    Args:
+        entry: Value read from the cache file for one URL.
+
+    Returns:
+        True for a dict with a body and at least one string validator.
+    """
+    if not isinstance(entry, dict) or "data" not in entry:
+        return False
+    validators = (entry.get("etag"), entry.get("last_modified"))
+    if not any(isinstance(value, str) for value in validators):
+        return False
+    if not all(
+        value is None or isinstance(value, str) for value in validators
+    ):
+        return False
+    return isinstance(entry.get("link", ""), str)
+
+
+def _page_number(url: str) -> Optional[int]:
+    """Return the numeric ``page`` query parameter of a URL, if any."""
+    pages = [
+        value for key, value in parse_qsl(urlsplit(url).query) if key == "page"
+    ]
+    if len(pages) != 1 or not pages[0].isdigit():
+        return None
+    return int(pages[0])
 
 
 class GitHubClient(ABC):
@@ -38,6 +147,30 @@ class GitHubClient(ABC):
         """
         pass
 
+    def iter_pull_request_pages(
+        self,
+        owner: str,
+        repo: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pull requests for a repository page by page.
+
+        The default implementation yields the complete listing as a single
+        page. Clients backed by a paginated API override this so callers
+        can start processing pull requests before the listing completes.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            since: Only return PRs created after this date (UTC).
+            until: Only return PRs created before this date (UTC).
+
+        Yields:
+            Lists of pull request dictionaries.
+        """
+        yield self.list_pull_requests(owner, repo, since=since, until=until)
+
     @abstractmethod
     def get_pull_request_details(
         self, owner: str, repo: str, number: int
@@ -187,6 +320,18 @@ class FakeGitHubClient(GitHubClient):
         self.issue_comments = issue_comments or {}
         self.timeline_events = timeline_events or {}
 
+        # created_at index for date filtering, built on the first filtered
+        # query so unqueried fixture data is never parsed
+        self._created_at_index: Optional[Tuple[List[float], List[int]]] = None
+
+        # Index by number for detail lookups; reversed so the first PR
+        # with a given number wins, as with a front-to-back scan
+        self._prs_by_number: Dict[int, Dict[str, Any]] = {
+            pr["number"]: pr
+            for pr in reversed(self.pull_requests)
+            if "number" in pr
+        }
+
     def list_pull_requests(
         self,
         _owner: str,
@@ -195,44 +340,57 @@ class FakeGitHubClient(GitHubClient):
         until: Optional[datetime] = None,
     ) -> List[Dict[str, Any]]:
         """List pull requests with optional date filtering."""
-        prs = self.pull_requests
-
         # Apply date filtering if requested
         if since or until:
-            filtered_prs = []
-            for pr in prs:
-                # Parse the created_at timestamp
-                created_at_str = pr.get("created_at", "")
-                if created_at_str:
-                    # Parse ISO format datetime
-                    created_at = datetime.fromisoformat(
-                        created_at_str.replace("Z", "+00:00")
-                    )
+            keys, order = self._get_created_at_index()
+            since_ts = _bound_timestamp(since)
+            until_ts = _bound_timestamp(until)
+            lo = 0 if since_ts is None else bisect_left(keys, since_ts)
+            hi = (
+                len(keys) if until_ts is None else bisect_right(keys, until_ts)
+            )
+
+            prs = self.pull_requests
+            if hi - lo == len(prs):
+                # Nothing excluded, so there is nothing to copy
+                return prs
+
+            # Return the window in listing order
+            return [prs[i] for i in sorted(order[lo:hi])]
 
-                    # Check since filter
-                    if since and created_at < since:
-                        continue
+        return self.pull_requests
 
-                    # Check until filter
-                    if until and created_at > until:
-                        continue
+    def _get_created_at_index(self) -> Tuple[List[float], List[int]]:
+        """Return PR creation timestamps in ascending order with positions.
 
-                    filtered_prs.append(pr)
-            return filtered_prs
+        The index is built once, on the first date-filtered query; the
+        fixture PRs are shared by every repository. Each timestamp is
+        parsed once and the PR positions are kept sorted by it, so a date
+        window is found by bisection. PRs without a timestamp never pass a
+        date filter.
 
-        return prs
+        Returns:
+            Tuple of sorted POSIX timestamps and the matching positions in
+            ``pull_requests``.
+        """
+        if self._created_at_index is None:
+            dated = sorted(
+                (_created_at_timestamp(pr["created_at"]), index)
+                for index, pr in enumerate(self.pull_requests)
+                if pr.get("created_at")
+            )
+            self._created_at_index = (
+                [created_ts for created_ts, _ in dated],
+                [index for _, index in dated],
+            )
+        return self._created_at_index
 
     def get_pull_request_details(
         self, _owner: str, _repo: str, number: int
     ) -> Dict[str, Any]:
         """Get details for a specific PR."""
-        # Find PR by number
-        for pr in self.pull_requests:
-            if pr.get("number") == number:
-                return pr
-
         # Return empty dict if not found
-        return {}
+        return self._prs_by_number.get(number, {})
 
     def get_pull_request_files(
         self, _owner: str, _repo: str, number: int
@@ -285,6 +443,7 @@ class HttpGitHubClient(GitHubClient):
         token: str,
         verify_ssl: bool = True,
         request_log_path: Optional[str] = None,
+        cache_path: Optional[str] = None,
     ):
         """Initialize HTTP GitHub client.
 
@@ -294,6 +453,8 @@ class HttpGitHubClient(GitHubClient):
             token: GitHub personal access token or OAuth token.
             verify_ssl: Whether to verify SSL certificates (default: True).
             request_log_path: Optional file path for logging all requests.
+            cache_path: Optional JSON file persisting ETag/Last-Modified
+                validators and response bodies across runs.
         """
         self.base_url = base_url.rstrip("/")
 
@@ -308,7 +469,22 @@ class HttpGitHubClient(GitHubClient):
         self.token = token
         self.verify_ssl = verify_ssl
         self.request_log_path = request_log_path
+        self._log_lock = threading.Lock()
+        self.cache_path = cache_path
+        self._cache_lock = threading.Lock()
+        self._response_cache: Dict[str, Dict[str, Any]] = {}
+        # URLs fetched during this run; only their entries are saved
+        self._requested_urls: Set[str] = set()
+        if cache_path:
+            self._response_cache = self._load_cache(cache_path)
+        self._repo_urls: Dict[Tuple[str, str], str] = {}
         self.session = requests.Session()
+        # requests keeps 10 connections per host by default; with PR
+        # assembly and page fetches running on threads, surplus
+        # connections would be discarded and re-handshaken later.
+        adapter = HTTPAdapter(pool_maxsize=_CONNECTION_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
                 "Authorization": f"token {token}",
@@ -323,6 +499,7 @@ class HttpGitHubClient(GitHubClient):
         token_env: str,
         verify_ssl: bool = True,
         request_log_path: Optional[str] = None,
+        cache_path: Optional[str] = None,
     ) -> "HttpGitHubClient":
         """Create client with token from environment variable.
 
@@ -331,6 +508,7 @@ class HttpGitHubClient(GitHubClient):
             token_env: Name of environment variable containing the token.
             verify_ssl: Whether to verify SSL certificates.
             request_log_path: Optional file path for logging all requests.
+            cache_path: Optional file path for the persistent HTTP cache.
 
         Returns:
             HttpGitHubClient instance.
@@ -349,21 +527,192 @@ class HttpGitHubClient(GitHubClient):
             token=token,
             verify_ssl=verify_ssl,
             request_log_path=request_log_path,
+            cache_path=cache_path,
+        )
+
+    def _repo_url(self, owner: str, repo: str) -> str:
+        """Return the API URL prefix of a repository.
+
+        The prefix is built once per repository, since every PR of that
+        repository needs it for each of its endpoint URLs.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+
+        Returns:
+            URL such as 'https://api.github.com/repos/owner/repo'.
+        """
+        key = (owner, repo)
+        repo_url = self._repo_urls.get(key)
+        if repo_url is None:
+            repo_url = f"{self.base_url}/repos/{owner}/{repo}"
+            self._repo_urls[key] = repo_url
+        return repo_url
+
+    @staticmethod
+    def _load_cache(cache_path: str) -> Dict[str, Dict[str, Any]]:
+        """Load the persisted HTTP cache, ignoring missing or corrupt files.
+
+        Entries that do not have the shape written by ``_get_json`` are
+        skipped, so a stale or foreign file only costs full requests.
+
+        Args:
+            cache_path: Path of the JSON cache file.
+
+        Returns:
+            Mapping of URL to cached validators, Link header and body.
+        """
+        try:
+            with open(cache_path) as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {
+            url: entry
+            for url, entry in cache.items()
+            if _is_cache_entry(entry)
+        }
+
+    def save_cache(self) -> None:
+        """Write the HTTP cache to ``cache_path``, if caching is enabled.
+
+        Only entries for URLs requested during this run are kept, so
+        responses that are no longer fetched do not accumulate in the file.
+        The cache holds raw response bodies, so the file is only readable
+        by its owner. It is written to a uniquely named temporary file and
+        then replaced atomically, so neither an interrupted run nor a
+        concurrent run sharing the cache leaves a truncated file behind.
+
+        Raises:
+            OSError: If the cache file cannot be written.
+        """
+        if not self.cache_path:
+            return
+        with self._cache_lock:
+            entries = {
+                url: entry
+                for url, entry in self._response_cache.items()
+                if url in self._requested_urls
+            }
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_path))
+        tmp_path: Optional[str] = None
+        try:
+            # NamedTemporaryFile creates the file with mode 0600
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_dir, suffix=".tmp", delete=False
+            ) as cache_file:
+                tmp_path = cache_file.name
+                json.dump(entries, cache_file)
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            if tmp_path is not None:
+                os.unlink(tmp_path)
+            raise
+
+    def _get_json(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Any, str]:
+        """Issue a GET request and decode the JSON body.
+
+        With a cache configured, the request is made conditional on the
+        stored ETag/Last-Modified validators, and a 304 Not Modified
+        response is answered from the cache. GitHub does not count 304
+        responses against the rate limit.
+
+        Args:
+            url: URL to fetch.
+            headers: Optional additional headers.
+
+        Returns:
+            Tuple of decoded JSON body and the response Link header.
+
+        Raises:
+            requests.HTTPError: If the request fails.
+        """
+        cached = None
+        if self.cache_path:
+            with self._cache_lock:
+                self._requested_urls.add(url)
+            cached = self._response_cache.get(url)
+        if cached:
+            headers = dict(headers or {})
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        self._log_request("GET", url)
+        response = self.session.get(
+            url, headers=headers, verify=self.verify_ssl
         )
+        if cached and response.status_code == 304:
+            return cached["data"], cached.get("link", "")
+        response.raise_for_status()
+
+        data = json_loads(response.content)
+        link_header = response.headers.get("Link", "")
+        if self.cache_path:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                with self._cache_lock:
+                    self._response_cache[url] = {
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "link": link_header,
+                        "data": data,
+                    }
+        return data, link_header
 
     def _log_request(self, method: str, url: str) -> None:
         """Append a request line to the request log file, if enabled."""
         if not self.request_log_path:
             return
         timestamp = datetime.now(timezone.utc).isoformat()
-        with open(self.request_log_path, "a") as log_file:
+        # Requests may be issued from collector worker threads
+        with self._log_lock, open(self.request_log_path, "a") as log_file:
             log_file.write(f"{timestamp} {method} {url}\n")
 
+    def _iter_pages(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Fetch the pages of a paginated endpoint one at a time.
+
+        Args:
+            url: Initial URL to fetch.
+            headers: Optional additional headers.
+
+        Yields:
+            The items of each page, in order.
+
+        Raises:
+            requests.HTTPError: If the request fails.
+        """
+        current_url: Optional[str] = url
+
+        while current_url:
+            data, link_header = self._get_json(current_url, headers=headers)
+            if not isinstance(data, list):
+                # Single object response
+                yield [data]
+                return
+            yield data
+
+            # Check for next page in Link header
+            current_url = self._parse_link_header(link_header).get("next")
+
     def _get_paginated(
         self, url: str, headers: Optional[Dict[str, str]] = None
     ) -> List[Dict[str, Any]]:
         """Fetch all pages of a paginated endpoint.
 
+        When the first response announces the page count through a
+        ``rel="last"`` link, the remaining pages are fetched concurrently;
+        otherwise the ``rel="next"`` links are followed one at a time.
+
         Args:
             url: Initial URL to fetch.
             headers: Optional additional headers.
@@ -374,49 +723,118 @@ class HttpGitHubClient(GitHubClient):
         Raises:
             requests.HTTPError: If the request fails.
         """
-        results = []
-        current_url: Optional[str] = url
+        data, link_header = self._get_json(url, headers=headers)
+        if not isinstance(data, list):
+            # Single object response
+            return [data]
+
+        links = self._parse_link_header(link_header)
+        next_url = links.get("next")
+        if not next_url:
+            return data
+
+        # Collect whole pages and flatten them once at the end
+        pages: List[List[Dict[str, Any]]] = [data]
+        page_urls = self._page_urls(next_url, links.get("last"))
+        if page_urls is None:
+            pages.extend(self._iter_pages(next_url, headers=headers))
+        else:
+            fetch = partial(self._get_json, headers=headers)
+            workers = min(len(page_urls), _MAX_PAGE_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map() yields in submission order, so pages stay in order
+                pages.extend(
+                    page_data
+                    for page_data, _ in executor.map(fetch, page_urls)
+                )
+        return list(chain.from_iterable(pages))
+
+    @staticmethod
+    def _page_urls(
+        next_url: str, last_url: Optional[str]
+    ) -> Optional[List[str]]:
+        """Build the URLs of all pages from ``next_url`` to ``last_url``.
 
-        while current_url:
-            self._log_request("GET", current_url)
-            response = self.session.get(
-                current_url, headers=headers, verify=self.verify_ssl
+        Args:
+            next_url: URL of the ``rel="next"`` page.
+            last_url: URL of the ``rel="last"`` page, if announced.
+
+        Returns:
+            The page URLs in order, or None if the links do not carry a
+            numeric ``page`` parameter (e.g. cursor-based pagination).
+        """
+        if not last_url:
+            return None
+        first_page = _page_number(next_url)
+        last_page = _page_number(last_url)
+        if first_page is None or last_page is None:
+            return None
+
+        parts = urlsplit(last_url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        urls = []
+        for page in range(first_page, last_page + 1):
+            page_query = [
+                (key, str(page) if key == "page" else value)
+                for key, value in query
+            ]
+            urls.append(
+                urlunsplit(parts._replace(query=urlencode(page_query)))
             )
-            response.raise_for_status()
+        return urls
 
-            data = response.json()
-            if isinstance(data, list):
-                results.extend(data)
-            else:
-                # Single object response
-                return [data]
+    @staticmethod
+    def _filter_by_created_at(
+        prs: List[Dict[str, Any]],
+        since: Optional[datetime],
+        until: Optional[datetime],
+    ) -> List[Dict[str, Any]]:
+        """Keep pull requests created within the optional date range.
 
-            # Check for next page in Link header
-            link_header = response.headers.get("Link", "")
-            current_url = self._parse_next_link(link_header)
+        Args:
+            prs: Pull request dictionaries.
+            since: Only keep PRs created after this date (UTC).
+            until: Only keep PRs created before this date (UTC).
+
+        Returns:
+            The filtered pull requests, or ``prs`` itself without filters.
+        """
+        if not (since or until):
+            return prs
+
+        # Convert the bounds once; each PR then costs a float comparison
+        since_ts = _bound_timestamp(since)
+        until_ts = _bound_timestamp(until)
 
-        return results
+        filtered_prs = []
+        for pr in prs:
+            created_at_str = pr.get("created_at", "")
+            if created_at_str:
+                created_ts = _created_at_timestamp(created_at_str)
 
-    def _parse_next_link(self, link_header: str) -> Optional[str]:
-        """Parse the 'next' URL from a Link header.
+                if since_ts is not None and created_ts < since_ts:
+                    continue
+
+                if until_ts is not None and created_ts > until_ts:
+                    continue
+
+                filtered_prs.append(pr)
+        return filtered_prs
+
+    @staticmethod
+    def _parse_link_header(link_header: str) -> Dict[str, str]:
+        """Parse the URLs of a Link header by relation.
 
         Args:
             link_header: Value of the Link header.
 
         Returns:
-            URL of the next page, or None if there is no next page.
+            Mapping of relation (e.g. 'next', 'last') to URL.
         """
         if not link_header:
-            return None
-
-        # Link header format: <url>; rel="next", <url>; rel="last"
-        links = link_header.split(",")
-        for link in links:
-            match = re.match(r'<([^>]+)>;\s*rel="next"', link.strip())
-            if match:
-                return match.group(1)
+            return {}
 
-        return None
+        return {rel: url for url, rel in _LINK_RE.findall(link_header)}
 
     def list_pull_requests(
         self,
@@ -434,31 +852,62 @@ class HttpGitHubClient(GitHubClient):
             until: Only return PRs created before this date (UTC).
 
         Returns:
-            List of pull request dictionaries.
+            List of pull request dictionaries, newest first.
         """
-        url = f"{self.base_url}/repos/{owner}/{repo}/pulls?state=all&per_page=100"
-        prs = self._get_paginated(url)
-
-        # Apply client-side date filtering if needed
-        if since or until:
-            filtered_prs = []
-            for pr in prs:
-                created_at_str = pr.get("created_at", "")
-                if created_at_str:
-                    created_at = datetime.fromisoformat(
-                        created_at_str.replace("Z", "+00:00")
+        if since:
+            # Page lazily so the listing stops at the first page that
+            # reaches back past since
+            return list(
+                chain.from_iterable(
+                    self.iter_pull_request_pages(
+                        owner, repo, since=since, until=until
                     )
+                )
+            )
+
+        prs = self._get_paginated(self._pulls_url(owner, repo))
 
-                    if since and created_at < since:
-                        continue
+        # Apply client-side date filtering if needed
+        return self._filter_by_created_at(prs, since, until)
 
-                    if until and created_at > until:
-                        continue
+    def iter_pull_request_pages(
+        self,
+        owner: str,
+        repo: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pull requests for a repository as each page arrives.
 
-                    filtered_prs.append(pr)
-            return filtered_prs
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            since: Only return PRs created after this date (UTC).
+            until: Only return PRs created before this date (UTC).
 
-        return prs
+        Yields:
+            Lists of pull request dictionaries, one per API page, newest
+            first. Paging stops after the first page that contains a PR
+            created before ``since``, as all later pages are older still.
+        """
+        since_ts = _bound_timestamp(since)
+        for page in self._iter_pages(self._pulls_url(owner, repo)):
+            yield self._filter_by_created_at(page, since, until)
+
+            oldest_created_at = page[-1].get("created_at") if page else None
+            if (
+                since_ts is not None
+                and oldest_created_at
+                and _created_at_timestamp(oldest_created_at) < since_ts
+            ):
+                return
+
+    def _pulls_url(self, owner: str, repo: str) -> str:
+        """Return the URL listing a repository's PRs, newest first."""
+        return (
+            f"{self._repo_url(owner, repo)}/pulls"
+            "?state=all&sort=created&direction=desc&per_page=100"
+        )
 
     def get_pull_request_details(
         self, owner: str, repo: str, number: int
@@ -473,11 +922,8 @@ class HttpGitHubClient(GitHubClient):
         Returns:
             Dictionary with PR details.
         """
-        url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{number}"
-        self._log_request("GET", url)
-        response = self.session.get(url, verify=self.verify_ssl)
-        response.raise_for_status()
-        result: Dict[str, Any] = response.json()
+        url = f"{self._repo_url(owner, repo)}/pulls/{number}"
+        result: Dict[str, Any] = self._get_json(url)[0]
         return result
 
     def get_pull_request_files(
@@ -493,7 +939,9 @@ class HttpGitHubClient(GitHubClient):
         Returns:
             List of file dictionaries with changes.
         """
-        url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{number}/files?per_page=100"
+        url = (
+            f"{self._repo_url(owner, repo)}/pulls/{number}/files?per_page=100"
+        )
         return self._get_paginated(url)
 
     def get_pull_request_commits(
@@ -509,7 +957,7 @@ class HttpGitHubClient(GitHubClient):
         Returns:
             List of commit dictionaries.
         """
-        url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{number}/commits?per_page=100"
+        url = f"{self._repo_url(owner, repo)}/pulls/{number}/commits?per_page=100"
         return self._get_paginated(url)
 
     def get_pull_request_reviews(
@@ -525,7 +973,7 @@ class HttpGitHubClient(GitHubClient):
         Returns:
             List of review dictionaries.
         """
-        url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{number}/reviews?per_page=100"
+        url = f"{self._repo_url(owner, repo)}/pulls/{number}/reviews?per_page=100"
         return self._get_paginated(url)
 
     def get_pull_request_review_comments(
@@ -541,7 +989,7 @@ class HttpGitHubClient(GitHubClient):
         Returns:
             List of review comment dictionaries.
         """
-        url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{number}/comments?per_page=100"
+        url = f"{self._repo_url(owner, repo)}/pulls/{number}/comments?per_page=100"
         return self._get_paginated(url)
 
     def get_issue_comments(
@@ -557,7 +1005,7 @@ class HttpGitHubClient(GitHubClient):
         Returns:
             List of issue comment dictionaries.
         """
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues/{number}/comments?per_page=100"
+        url = f"{self._repo_url(owner, repo)}/issues/{number}/comments?per_page=100"
         return self._get_paginated(url)
 
     def get_issue_timeline(
@@ -573,9 +1021,5 @@ class HttpGitHubClient(GitHubClient):
         Returns:
             List of timeline event dictionaries.
         """
-        url = f"{self.base_url}/repos/{owner}/{repo}/issues/{number}/timeline?per_page=100"
-
-        # Timeline requires a special media type accept header
-        headers = {"Accept": "application/vnd.github.mockingbird-preview+json"}
-
-        return self._get_paginated(url, headers=headers)
+        url = f"{self._repo_url(owner, repo)}/issues/{number}/timeline?per_page=100"
+        return self._get_paginated(url, headers=_TIMELINE_HEADERS)
@@ -4,8 +4,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
+from github_statistics._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class CommitInfo:
     """Information about a commit in a pull request.
 
@@ -22,7 +24,7 @@ class CommitInfo:
     message: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CommentInfo:
     """Information about a comment on a pull request.
 
@@ -37,7 +39,7 @@ class CommentInfo:
     body: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReviewEvent:
     """A review event on a pull request.
 
@@ -52,7 +54,7 @@ class ReviewEvent:
     state: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReviewRequestEvent:
     """A review request event on a pull request.
 
@@ -65,7 +67,7 @@ class ReviewRequestEvent:
     requested_at: datetime
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReadyForReviewEvent:
     """Event indicating a PR transitioned to ready-for-review state.
 
@@ -76,7 +78,7 @@ class ReadyForReviewEvent:
     ready_at: datetime
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PullRequest:
     """A GitHub pull request with all associated data.
 
@@ -8,18 +8,8 @@ from typing import Dict
 
 from github_statistics.stats import Distribution, GroupStats, RepositoryStats
 
-
-def _format_number(value: float, decimals: int = 2) -> str:
-    """Format a number with specified decimal places.
-
-    Args:
-        value: Number to format.
-        decimals: Number of decimal places (default: 2).
-
-    Returns:
-        Formatted string.
-    """
-    return f"{value:.{decimals}f}"
+# Rendered for every metric without values
+_NO_DATA = "no data"
 
 
 def _format_distribution(dist: Distribution, unit: str = "") -> str:
@@ -33,15 +23,17 @@ def _format_distribution(dist: Distribution, unit: str = "") -> str:
         Formatted string showing distribution statistics.
     """
     if dist.count == 0:
-        return "no data"
+        return _NO_DATA
 
+    # Literal format specs let the f-string format each value directly,
+    # without building a nested spec or calling a helper per number.
     unit_str = f" {unit}" if unit else ""
     return (
         f"count: {dist.count}, "
-        f"min: {_format_number(dist.minimum)}{unit_str}, "
-        f"median: {_format_number(dist.median)}{unit_str}, "
-        f"mean: {_format_number(dist.mean)}{unit_str}, "
-        f"max: {_format_number(dist.maximum)}{unit_str}"
+        f"min: {dist.minimum:.2f}{unit_str}, "
+        f"median: {dist.median:.2f}{unit_str}, "
+        f"mean: {dist.mean:.2f}{unit_str}, "
+        f"max: {dist.maximum:.2f}{unit_str}"
     )
 
 
@@ -54,7 +46,7 @@ def _format_percentage(value: float) -> str:
     Returns:
         Formatted percentage string.
     """
-    return f"{_format_number(value)}%"
+    return f"{value:.2f}%"
 
 
 def render_report(
@@ -3,18 +3,20 @@ Statistics computation - metrics and distributions.
 
 This module computes statistical metrics from pull request data,
 including both repository-level and user-level statistics.
-Uses Python standard library (statistics, datetime) for calculations.
+Uses Python standard library (math, datetime) for calculations.
 """
 
-import statistics
+import math
+from bisect import bisect_right
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from github_statistics.models import PullRequest
+from github_statistics.models import PullRequest, ReviewEvent
 
 
-@dataclass
+@dataclass(frozen=True)
 class Distribution:
     """Statistical distribution of numeric values.
 
@@ -116,6 +118,13 @@ class DataProtectionCheckResult:
     violations: List[DataProtectionViolation]
 
 
+# Shared result for every empty metric; Distribution is frozen, so the
+# single instance can be handed out safely.
+_EMPTY_DISTRIBUTION = Distribution(
+    count=0, minimum=0.0, maximum=0.0, mean=0.0, median=0.0
+)
+
+
 def _compute_distribution(values: List[float]) -> Distribution:
     """Compute a distribution from a list of numeric values.
 
@@ -126,16 +135,26 @@ def _compute_distribution(values: List[float]) -> Distribution:
         Distribution object with statistics.
     """
     if not values:
-        return Distribution(
-            count=0, minimum=0.0, maximum=0.0, mean=0.0, median=0.0
-        )
+        return _EMPTY_DISTRIBUTION
+
+    # One C-level sort yields min, max and median; statistics.median would
+    # sort its own copy on top of the separate min() and max() passes.
+    ordered = sorted(values)
+    count = len(ordered)
+    middle = count // 2
+    if count % 2:
+        median = ordered[middle]
+    else:
+        median = (ordered[middle - 1] + ordered[middle]) / 2
 
     return Distribution(
-        count=len(values),
-        minimum=min(values),
-        maximum=max(values),
-        mean=statistics.mean(values),
-        median=statistics.median(values),
+        count=count,
+        minimum=ordered[0],
+        maximum=ordered[-1],
+        # fsum is a single exact C pass; statistics.mean converts every
+        # value to a Fraction first.
+        mean=math.fsum(ordered) / count,
+        median=median,
     )
 
 
@@ -167,13 +186,89 @@ def _hours_between(start: datetime, end: datetime) -> float:
     return delta.total_seconds() / 3600.0  # seconds per hour
 
 
-def _is_in_period(
-    dt: datetime, since: Optional[datetime], until: Optional[datetime]
-) -> bool:
-    """Check whether a datetime is in the inclusive [since, until] period."""
-    if since and dt < since:
-        return False
-    return not (until and dt > until)
+def _sorted_times_by_person(
+    events: Iterable[Tuple[str, datetime]],
+) -> Dict[str, List[datetime]]:
+    """Group event times by person, each list sorted ascending.
+
+    Args:
+        events: Pairs of (person, event time).
+
+    Returns:
+        Dictionary mapping each person to their sorted event times.
+    """
+    grouped: Dict[str, List[datetime]] = {}
+    for person, when in events:
+        grouped.setdefault(person, []).append(when)
+    for times in grouped.values():
+        times.sort()
+    return grouped
+
+
+def _first_after(
+    times: List[datetime], moment: datetime
+) -> Optional[datetime]:
+    """Return the earliest of the sorted times strictly after moment.
+
+    Args:
+        times: Event times sorted ascending.
+        moment: Reference time.
+
+    Returns:
+        The first later time, or None if there is none.
+    """
+    index = bisect_right(times, moment)
+    return times[index] if index < len(times) else None
+
+
+def _merge_open_intervals(
+    intervals: Iterable[Tuple[datetime, Optional[datetime]]],
+) -> List[Tuple[datetime, Optional[datetime]]]:
+    """Merge overlapping open intervals into sorted, disjoint ones.
+
+    Intervals that only touch stay separate, because their shared endpoint
+    lies in neither of them.
+
+    Args:
+        intervals: Pairs of (start, end); an end of None is unbounded.
+
+    Returns:
+        Disjoint intervals sorted by start time.
+    """
+    merged: List[Tuple[datetime, Optional[datetime]]] = []
+    for start, end in sorted(intervals, key=lambda interval: interval[0]):
+        if merged:
+            last_start, last_end = merged[-1]
+            if last_end is None or start < last_end:
+                if last_end is not None and (end is None or end > last_end):
+                    merged[-1] = (last_start, end)
+                continue
+        merged.append((start, end))
+    return merged
+
+
+def _period_predicate(
+    since: Optional[datetime], until: Optional[datetime]
+) -> Callable[[datetime], bool]:
+    """Return a check for whether a moment lies in the optional period.
+
+    The bounds are resolved once per call, and a missing bound is never
+    compared, so moments are not checked against substituted sentinels.
+
+    Args:
+        since: Inclusive start of the period, or None for no lower bound.
+        until: Inclusive end of the period, or None for no upper bound.
+
+    Returns:
+        Callable returning True for moments within the period.
+    """
+    if since is not None and until is not None:
+        return lambda moment: since <= moment <= until
+    if since is not None:
+        return since.__le__
+    if until is not None:
+        return until.__ge__
+    return lambda _moment: True
 
 
 def get_active_users_in_period(
@@ -184,13 +279,16 @@ def get_active_users_in_period(
 ) -> Set[str]:
     """Return users with at least one commit in the selected period."""
     repo_filter = set(repositories) if repositories else None
+    in_period = _period_predicate(since, until)
     active_users: Set[str] = set()
     for pr in pull_requests:
         if repo_filter is not None and pr.repository not in repo_filter:
             continue
-        for commit in pr.commits:
-            if _is_in_period(commit.committed_at, since, until):
-                active_users.add(commit.author)
+        active_users.update(
+            commit.author
+            for commit in pr.commits
+            if in_period(commit.committed_at)
+        )
     return active_users
 
 
@@ -200,8 +298,8 @@ def compute_active_group_counts(
     """Compute active-member counts per configured group."""
     counts: Dict[str, int] = {}
     for group_name, members in user_groups.items():
-        member_set = set(members)
-        counts[group_name] = len(member_set.intersection(active_users))
+        # Probe the already-hashed active set instead of hashing members
+        counts[group_name] = len(active_users.intersection(members))
     return counts
 
 
@@ -316,64 +414,57 @@ def classify_commits_requested_vs_unrequested(
     # A cycle is (reviewer, start_time, end_time or None if open)
     requested_cycles = []
 
+    # Index request and approval times per reviewer once, so each cycle
+    # end is a binary search instead of a scan over all events.
+    request_times = _sorted_times_by_person(
+        (rr.requested_reviewer, rr.requested_at) for rr in pr.review_requests
+    )
+    approval_times = _sorted_times_by_person(
+        (r.reviewer, r.submitted_at)
+        for r in pr.reviews
+        if r.state == "APPROVED"
+    )
+
     # Build cycles from reviews
     for review in pr.reviews:
         if review.state == "CHANGES_REQUESTED":
             reviewer = review.reviewer
             start_time = review.submitted_at
 
-            # Find when this cycle closes
-            end_time = None
-
-            # Check for subsequent review request to same reviewer
-            later_requests = [
-                rr
-                for rr in pr.review_requests
-                if rr.requested_reviewer == reviewer
-                and rr.requested_at > start_time
-            ]
-            if later_requests:
-                earliest_request = min(
-                    later_requests, key=lambda r: r.requested_at
-                )
-                end_time = earliest_request.requested_at
-
-            # Check for subsequent APPROVED review from same reviewer
-            later_approvals = [
-                r
-                for r in pr.reviews
-                if r.reviewer == reviewer
-                and r.submitted_at > start_time
-                and r.state == "APPROVED"
-            ]
-            if later_approvals:
-                earliest_approval = min(
-                    later_approvals, key=lambda r: r.submitted_at
-                )
-                # Use earliest of review request or approval
-                if (
-                    end_time is None
-                    or earliest_approval.submitted_at < end_time
-                ):
-                    end_time = earliest_approval.submitted_at
+            # A cycle closes at the earliest subsequent review request to,
+            # or APPROVED review from, the same reviewer
+            end_time = _first_after(
+                request_times.get(reviewer, []), start_time
+            )
+            approved_at = _first_after(
+                approval_times.get(reviewer, []), start_time
+            )
+            if approved_at is not None and (
+                end_time is None or approved_at < end_time
+            ):
+                end_time = approved_at
 
             requested_cycles.append((reviewer, start_time, end_time))
 
-    # Classify each commit
+    # Classify each commit with a single sweep: commits and the merged
+    # cycles are both in time order, so the cycle pointer only moves forward
+    cycles = _merge_open_intervals(
+        (start_time, end_time) for _, start_time, end_time in requested_cycles
+    )
     requested_count = 0
     unrequested_count = 0
+    cycle_index = 0
 
     for commit in sorted_commits:
-        # Check if commit falls within any requested cycle
-        is_requested = False
-        for _, start_time, end_time in requested_cycles:
-            if commit.committed_at > start_time and (
-                end_time is None or commit.committed_at < end_time
-            ):
-                is_requested = True
+        committed_at = commit.committed_at
+        # Skip cycles that closed at or before this commit
+        while cycle_index < len(cycles):
+            end_time = cycles[cycle_index][1]
+            if end_time is None or committed_at < end_time:
                 break
+            cycle_index += 1
 
-        if is_requested:
+        if cycle_index < len(cycles) and cycles[cycle_index][0] < committed_at:
             requested_count += 1
         else:
             unrequested_count += 1
@@ -397,12 +488,19 @@ def compute_repository_stats(
     if until is None:
         until = datetime.now(timezone.utc)
 
-    # Duration metrics
-    open_durations = []
-    closed_durations = []
-    merged_durations = []
-
+    open_durations: List[float] = []
+    closed_durations: List[float] = []
+    merged_durations: List[float] = []
+    time_to_first_review_values: List[float] = []
+    commits_per_pr_values: List[float] = []
+    comments_per_100_loc_values: List[float] = []
+    re_reviews_values: List[float] = []
+    changes_to_rerequest_values: List[float] = []
+
+    # A single sweep over the pull requests feeds every metric, so each PR
+    # is visited once instead of once per metric.
     for pr in pull_requests:
+        # Duration metrics
         if pr.state == "open":
             open_durations.append(_days_between(pr.created_at, until))
         elif pr.merged_at:
@@ -410,67 +508,45 @@ def compute_repository_stats(
         elif pr.closed_at:
             closed_durations.append(_days_between(pr.created_at, pr.closed_at))
 
-    # Time to first review
-    time_to_first_review_values = []
-    for pr in pull_requests:
+        # Time to first review
         if pr.reviews:
             first_review = min(pr.reviews, key=lambda r: r.submitted_at)
             time_to_first_review_values.append(
                 _days_between(pr.created_at, first_review.submitted_at)
             )
 
-    # Commits per PR
-    commits_per_pr_values = [float(len(pr.commits)) for pr in pull_requests]
+        # Commits per PR
+        commits_per_pr_values.append(float(len(pr.commits)))
 
-    # Comments per 100 LOC
-    comments_per_100_loc_values = []
-    for pr in pull_requests:
+        # Comments per 100 LOC
         total_loc = pr.additions + pr.deletions
         if total_loc > 0:
             comments_per_100_loc = (len(pr.comments) / total_loc) * 100.0
             comments_per_100_loc_values.append(comments_per_100_loc)
 
-    # Re-reviews per PR
-    re_reviews_values = []
-    for pr in pull_requests:
-        # Count reviews by each reviewer
-        reviewer_counts: Dict[str, int] = {}
-        for review in pr.reviews:
-            reviewer_counts[review.reviewer] = (
-                reviewer_counts.get(review.reviewer, 0) + 1
-            )
-        # Count re-reviews (reviews after the first)
-        re_reviews = sum(
-            count - 1 for count in reviewer_counts.values() if count > 1
+        # Re-reviews per PR: every review after a reviewer's first one.
+        # Summing (count - 1) over reviewers equals total minus distinct.
+        re_reviews = len(pr.reviews) - len(
+            {review.reviewer for review in pr.reviews}
         )
         if re_reviews > 0:
             re_reviews_values.append(float(re_reviews))
 
-    # Time between CHANGES_REQUESTED and re-request
-    changes_to_rerequest_values = []
-    for pr in pull_requests:
-        # Find CHANGES_REQUESTED reviews
-        changes_requested_reviews = [
-            r for r in pr.reviews if r.state == "CHANGES_REQUESTED"
-        ]
-
-        for changes_review in changes_requested_reviews:
-            # Find next review request after this CHANGES_REQUESTED
-            later_requests = [
-                rr
-                for rr in pr.review_requests
-                if rr.requested_at > changes_review.submitted_at
-                and rr.requested_reviewer == changes_review.reviewer
-            ]
-
-            if later_requests:
-                next_request = min(
-                    later_requests, key=lambda r: r.requested_at
-                )
-                time_diff = _days_between(
-                    changes_review.submitted_at, next_request.requested_at
+        # Time between CHANGES_REQUESTED and the next re-request
+        request_times = _sorted_times_by_person(
+            (rr.requested_reviewer, rr.requested_at)
+            for rr in pr.review_requests
+        )
+        for review in pr.reviews:
+            if review.state != "CHANGES_REQUESTED":
+                continue
+            next_request_at = _first_after(
+                request_times.get(review.reviewer, []), review.submitted_at
+            )
+            if next_request_at is not None:
+                changes_to_rerequest_values.append(
+                    _days_between(review.submitted_at, next_request_at)
                 )
-                changes_to_rerequest_values.append(time_diff)
 
     return RepositoryStats(
         open_pr_duration=_compute_distribution(open_durations),
@@ -516,57 +592,55 @@ def _collect_user_data(pull_requests: List[PullRequest]) -> Dict[str, Dict]:
         total_loc = pr.additions + pr.deletions
         user_data[pr.author]["loc_values"].append(float(total_loc))
 
+        # Count comments per author in one pass; both comment metrics only
+        # apply to PRs with changed lines
+        comment_counts = (
+            Counter(c.author for c in pr.comments) if total_loc > 0 else None
+        )
+
         # Comments as author
-        if total_loc > 0:
-            author_comments = [c for c in pr.comments if c.author == pr.author]
-            if author_comments:
-                comments_per_100 = (len(author_comments) / total_loc) * 100.0
+        if comment_counts is not None:
+            author_comment_count = comment_counts.get(pr.author, 0)
+            if author_comment_count:
+                comments_per_100 = (author_comment_count / total_loc) * 100.0
                 user_data[pr.author]["comments_as_author"].append(
                     comments_per_100
                 )
 
-        # Process review timing
+        # Group this PR's reviews by reviewer once, in submission order;
+        # review timing and the approval rates below both read from it
+        reviews_by_reviewer: Dict[str, List[ReviewEvent]] = {}
+        for review in sorted(pr.reviews, key=lambda r: r.submitted_at):
+            reviews_by_reviewer.setdefault(review.reviewer, []).append(review)
+        review_times = {
+            reviewer: [r.submitted_at for r in reviews]
+            for reviewer, reviews in reviews_by_reviewer.items()
+        }
+
+        # Process review timing: pair each request with the reviewer's
+        # first review submitted after it
         for review_request in pr.review_requests:
             reviewer = review_request.requested_reviewer
             _init_user(reviewer)
 
-            # Find review submitted after this request
-            matching_reviews = [
-                r
-                for r in pr.reviews
-                if r.reviewer == reviewer
-                and r.submitted_at > review_request.requested_at
-            ]
-
-            if matching_reviews:
-                # Find the first review after this request
-                next_review = min(
-                    matching_reviews, key=lambda r: r.submitted_at
-                )
+            next_review_at = _first_after(
+                review_times.get(reviewer, []), review_request.requested_at
+            )
+            if next_review_at is not None:
                 hours = _hours_between(
-                    review_request.requested_at, next_review.submitted_at
+                    review_request.requested_at, next_review_at
                 )
                 user_data[reviewer]["review_times"].append(hours)
 
         # Direct approval rate (APPROVED without prior CHANGES_REQUESTED)
-        # Group reviews by reviewer for this PR
-        pr_reviewer_reviews: Dict[str, List] = {}
-        for review in pr.reviews:
-            if review.reviewer not in pr_reviewer_reviews:
-                pr_reviewer_reviews[review.reviewer] = []
-            pr_reviewer_reviews[review.reviewer].append(review)
-
-        for reviewer, reviews in pr_reviewer_reviews.items():
+        for reviewer, reviews in reviews_by_reviewer.items():
             _init_user(reviewer)
 
             # Count this PR as reviewed
             user_data[reviewer]["prs_reviewed"] += 1
 
-            # Sort by submission time
-            sorted_reviews = sorted(reviews, key=lambda r: r.submitted_at)
-
             # Check if first review is APPROVED
-            if sorted_reviews[0].state == "APPROVED":
+            if reviews[0].state == "APPROVED":
                 user_data[reviewer]["direct_approval_count"] += 1
 
             # Check if any review is CHANGES_REQUESTED
@@ -574,18 +648,11 @@ def _collect_user_data(pull_requests: List[PullRequest]) -> Dict[str, Dict]:
                 user_data[reviewer]["prs_with_changes_requested"] += 1
 
         # Comments per 100 LOC as reviewer
-        if total_loc > 0:
-            # Group comments by author
-            comment_authors = {c.author for c in pr.comments}
-            for commenter in comment_authors:
+        if comment_counts is not None:
+            for commenter, comment_count in comment_counts.items():
                 if commenter != pr.author:  # Exclude PR author
                     _init_user(commenter)
-                    commenter_comments = [
-                        c for c in pr.comments if c.author == commenter
-                    ]
-                    comments_per_100 = (
-                        len(commenter_comments) / total_loc
-                    ) * 100.0
+                    comments_per_100 = (comment_count / total_loc) * 100.0
                     user_data[commenter]["comments_as_reviewer"].append(
                         comments_per_100
                     )
@@ -631,6 +698,30 @@ def compute_user_stats(
     return result
 
 
+def _empty_group_stats(
+    member_count: int, active_member_count: int
+) -> GroupStats:
+    """Build group statistics for a group without any recorded activity.
+
+    Args:
+        member_count: Number of configured members.
+        active_member_count: Number of members active in the period.
+
+    Returns:
+        GroupStats with empty distributions and zero rates.
+    """
+    return GroupStats(
+        member_count=member_count,
+        active_member_count=active_member_count,
+        time_to_submit_review=_EMPTY_DISTRIBUTION,
+        changes_requested_rate=0.0,
+        direct_approval_rate=0.0,
+        loc_per_created_pr=_EMPTY_DISTRIBUTION,
+        comments_per_100_loc_as_reviewer=_EMPTY_DISTRIBUTION,
+        comments_per_100_loc_as_author=_EMPTY_DISTRIBUTION,
+    )
+
+
 def compute_group_stats(
     pull_requests: List[PullRequest],
     user_groups: Dict[str, List[str]],
@@ -641,6 +732,20 @@ def compute_group_stats(
     group_stats: Dict[str, GroupStats] = {}
 
     for group_name, members in user_groups.items():
+        active_member_count = 0
+        if active_group_counts is not None:
+            active_member_count = active_group_counts.get(group_name, 0)
+
+        member_records = [
+            user_data[member] for member in members if member in user_data
+        ]
+        if not member_records:
+            # Nothing to aggregate for groups without any recorded activity
+            group_stats[group_name] = _empty_group_stats(
+                len(members), active_member_count
+            )
+            continue
+
         group_review_times: List[float] = []
         group_loc_values: List[float] = []
         group_comments_as_reviewer: List[float] = []
@@ -649,10 +754,7 @@ def compute_group_stats(
         group_prs_with_changes_requested = 0
         group_direct_approval_count = 0
 
-        for member in members:
-            member_data = user_data.get(member)
-            if not member_data:
-                continue
+        for member_data in member_records:
             group_review_times.extend(member_data["review_times"])
             group_loc_values.extend(member_data["loc_values"])
             group_comments_as_reviewer.extend(
@@ -676,10 +778,6 @@ def compute_group_stats(
             changes_requested_rate = 0.0
             direct_approval_rate = 0.0
 
-        active_member_count = 0
-        if active_group_counts is not None:
-            active_member_count = active_group_counts.get(group_name, 0)
-
         group_stats[group_name] = GroupStats(
             member_count=len(members),
             active_member_count=active_member_count,
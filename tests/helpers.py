@@ -0,0 +1,29 @@
+"""Shared helpers for the test suite."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Checkout root, so child interpreters import this source tree
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def run_python(code: str) -> "subprocess.CompletedProcess[str]":
+    """Run code in a fresh interpreter with the checkout importable.
+
+    The child runs from the repository root, so ``github_statistics`` is
+    found without an editable install, whatever directory pytest runs in.
+
+    Args:
+        code: Python source passed to ``python -c``.
+
+    Returns:
+        The completed process, with text stdout and stderr captured.
+    """
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    )
@@ -2,7 +2,9 @@
 Tests for CLI argument parsing and handling.
 """
 
+import dataclasses
 import os
+import re
 import sys
 from datetime import datetime, timezone
 
@@ -11,6 +13,26 @@ import yaml
 
 from github_statistics.cli import RunOptions, main, parse_arguments
 from github_statistics.config import Config
+from tests.helpers import run_python
+
+# libyaml-backed dumper when available, as load_config does for loading
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Expected messages for rejected --since/--until values
+_SINCE_ERROR = re.compile(r"Invalid date format.*since")
+_UNTIL_ERROR = re.compile(r"Invalid date format.*until")
+
+
+@pytest.fixture(scope="module")
+def base_config():
+    """Single-repository config shared by the RunOptions tests."""
+    return Config(
+        github_base_url="https://github.com/api/v3",
+        github_token_env="GITHUB_TOKEN",
+        github_verify_ssl=True,
+        repositories=["org/repo1"],
+        users=["alice"],
+    )
 
 
 def test_parse_arguments_minimal():
@@ -26,20 +48,28 @@ def test_parse_arguments_minimal():
     assert args.max_workers == 4  # default
 
 
-def test_parse_arguments_with_since():
-    """Test parsing with --since flag."""
-    args = parse_arguments(["config.yaml", "--since", "2024-01-01"])
-
-    assert args.config_path == "config.yaml"
-    assert args.since == "2024-01-01"
-
-
-def test_parse_arguments_with_until():
-    """Test parsing with --until flag."""
-    args = parse_arguments(["config.yaml", "--until", "2024-12-31"])
+@pytest.mark.parametrize(
+    "flag,value,attr,expected",
+    [
+        ("--since", "2024-01-01", "since", "2024-01-01"),
+        ("--until", "2024-12-31", "until", "2024-12-31"),
+        ("--users", "alice,bob,charlie", "users", "alice,bob,charlie"),
+        (
+            "--repos",
+            "org1/repo1,org2/repo2",
+            "repos",
+            "org1/repo1,org2/repo2",
+        ),
+        ("--output", "my_report.md", "output", "my_report.md"),
+        ("--max-workers", "8", "max_workers", 8),
+    ],
+)
+def test_parse_arguments_single_flag(flag, value, attr, expected):
+    """Test parsing each optional flag on its own."""
+    args = parse_arguments(["config.yaml", flag, value])
 
     assert args.config_path == "config.yaml"
-    assert args.until == "2024-12-31"
+    assert getattr(args, attr) == expected
 
 
 def test_parse_arguments_with_since_and_until():
@@ -52,34 +82,6 @@ def test_parse_arguments_with_since_and_until():
     assert args.until == "2024-12-31"
 
 
-def test_parse_arguments_with_users():
-    """Test parsing with --users flag."""
-    args = parse_arguments(["config.yaml", "--users", "alice,bob,charlie"])
-
-    assert args.users == "alice,bob,charlie"
-
-
-def test_parse_arguments_with_repos():
-    """Test parsing with --repos flag."""
-    args = parse_arguments(["config.yaml", "--repos", "org1/repo1,org2/repo2"])
-
-    assert args.repos == "org1/repo1,org2/repo2"
-
-
-def test_parse_arguments_with_output():
-    """Test parsing with --output flag."""
-    args = parse_arguments(["config.yaml", "--output", "my_report.md"])
-
-    assert args.output == "my_report.md"
-
-
-def test_parse_arguments_with_max_workers():
-    """Test parsing with --max-workers flag."""
-    args = parse_arguments(["config.yaml", "--max-workers", "8"])
-
-    assert args.max_workers == 8
-
-
 def test_parse_arguments_all_flags():
     """Test parsing with all optional flags."""
     args = parse_arguments(
@@ -111,12 +113,20 @@ def test_parse_arguments_all_flags():
     assert args.overwrite_data_protection is True
 
 
-def test_create_run_options_minimal():
+def test_parse_arguments_repeated_calls_are_independent():
+    """Test that reusing the cached parser does not leak earlier values."""
+    first = parse_arguments(["config.yaml", "--since", "2024-01-01"])
+    second = parse_arguments(["other.yaml"])
+
+    assert first.since == "2024-01-01"
+    assert second.config_path == "other.yaml"
+    assert second.since is None
+
+
+def test_create_run_options_minimal(base_config):
     """Test creating RunOptions from config only."""
-    config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
-        github_verify_ssl=True,
+    config = dataclasses.replace(
+        base_config,
         repositories=["org/repo1", "org/repo2"],
         users=["alice", "bob"],
     )
@@ -134,51 +144,31 @@ def test_create_run_options_minimal():
     assert options.max_workers == 4
 
 
-def test_create_run_options_with_date_range():
+def test_create_run_options_with_date_range(base_config):
     """Test creating RunOptions with date range."""
-    config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
-        github_verify_ssl=True,
-        repositories=["org/repo1"],
-        users=["alice"],
-    )
-
     args = parse_arguments(
         ["config.yaml", "--since", "2024-01-01", "--until", "2024-12-31"]
     )
-    options = RunOptions.from_config_and_args(config, args)
+    options = RunOptions.from_config_and_args(base_config, args)
 
     assert options.since == datetime(2024, 1, 1, tzinfo=timezone.utc)
     assert options.until == datetime(2024, 12, 31, tzinfo=timezone.utc)
 
 
-def test_create_run_options_normalizes_offset_datetime_to_utc():
+def test_create_run_options_normalizes_offset_datetime_to_utc(base_config):
     """Test date args with explicit offset are normalized to UTC."""
-    config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
-        github_verify_ssl=True,
-        repositories=["org/repo1"],
-        users=["alice"],
-    )
-
     args = parse_arguments(
         ["config.yaml", "--since", "2024-01-01T01:00:00+01:00"]
     )
-    options = RunOptions.from_config_and_args(config, args)
+    options = RunOptions.from_config_and_args(base_config, args)
 
     assert options.since == datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
 
 
-def test_create_run_options_repos_narrows_config():
+def test_create_run_options_repos_narrows_config(base_config):
     """Test that --repos CLI flag narrows configured repositories."""
-    config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
-        github_verify_ssl=True,
-        repositories=["org/repo1", "org/repo2", "org/repo3"],
-        users=["alice"],
+    config = dataclasses.replace(
+        base_config, repositories=["org/repo1", "org/repo2", "org/repo3"]
     )
 
     args = parse_arguments(["config.yaml", "--repos", "org/repo1,org/repo3"])
@@ -188,14 +178,10 @@ def test_create_run_options_repos_narrows_config():
     assert options.repositories == ["org/repo1", "org/repo3"]
 
 
-def test_create_run_options_repos_invalid_ignored():
+def test_create_run_options_repos_invalid_ignored(base_config):
     """Test that --repos with repos not in config are ignored."""
-    config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
-        github_verify_ssl=True,
-        repositories=["org/repo1", "org/repo2"],
-        users=["alice"],
+    config = dataclasses.replace(
+        base_config, repositories=["org/repo1", "org/repo2"]
     )
 
     args = parse_arguments(["config.yaml", "--repos", "org/repo1,org/invalid"])
@@ -205,14 +191,10 @@ def test_create_run_options_repos_invalid_ignored():
     assert options.repositories == ["org/repo1"]
 
 
-def test_create_run_options_users_overrides_config():
+def test_create_run_options_users_overrides_config(base_config):
     """Test that --users CLI flag overrides configured users."""
-    config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
-        github_verify_ssl=True,
-        repositories=["org/repo1"],
-        users=["alice", "bob", "charlie"],
+    config = dataclasses.replace(
+        base_config, users=["alice", "bob", "charlie"]
     )
 
     args = parse_arguments(["config.yaml", "--users", "alice,charlie"])
@@ -222,68 +204,137 @@ def test_create_run_options_users_overrides_config():
     assert options.users == ["alice", "charlie"]
 
 
-def test_create_run_options_custom_output():
-    """Test that --output CLI flag sets custom output path."""
-    config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
-        github_verify_ssl=True,
-        repositories=["org/repo1"],
-        users=["alice"],
+def test_create_run_options_lists_strip_whitespace(base_config):
+    """Test that whitespace around comma-separated CLI values is ignored."""
+    config = dataclasses.replace(
+        base_config, repositories=["org/repo1", "org/repo2"]
     )
 
-    args = parse_arguments(["config.yaml", "--output", "custom_report.md"])
+    args = parse_arguments(
+        [
+            "config.yaml",
+            "--repos",
+            " org/repo2 ,  org/repo1 ",
+            "--users",
+            "alice , bob",
+        ]
+    )
     options = RunOptions.from_config_and_args(config, args)
 
-    assert options.output == "custom_report.md"
+    assert options.repositories == ["org/repo1", "org/repo2"]
+    assert options.users == ["alice", "bob"]
 
 
-def test_create_run_options_max_workers():
-    """Test that --max-workers CLI flag is passed through."""
+def test_create_run_options_http_cache_path(tmp_path):
+    """Test that --http-cache places the cache next to the config file."""
     config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
+        github_base_url="https://api.github.com",
         github_verify_ssl=True,
         repositories=["org/repo1"],
-        users=["alice"],
+        users=[],
+    )
+    config_file = tmp_path / "my_config.yaml"
+
+    options = RunOptions.from_config_and_args(
+        config, parse_arguments([str(config_file), "--http-cache"])
+    )
+    default_options = RunOptions.from_config_and_args(
+        config, parse_arguments([str(config_file)])
+    )
+
+    assert options.http_cache_path == str(
+        tmp_path / "my_config_http_cache.json"
     )
+    assert default_options.http_cache_path is None
 
+
+def test_create_run_options_custom_output(base_config):
+    """Test that --output CLI flag sets custom output path."""
+    args = parse_arguments(["config.yaml", "--output", "custom_report.md"])
+    options = RunOptions.from_config_and_args(base_config, args)
+
+    assert options.output == "custom_report.md"
+
+
+def test_create_run_options_max_workers(base_config):
+    """Test that --max-workers CLI flag is passed through."""
     args = parse_arguments(["config.yaml", "--max-workers", "10"])
-    options = RunOptions.from_config_and_args(config, args)
+    options = RunOptions.from_config_and_args(base_config, args)
 
     assert options.max_workers == 10
 
 
-def test_invalid_date_format_since():
+def test_invalid_date_format_since(base_config):
     """Test that invalid --since date format raises error."""
-    config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
-        github_verify_ssl=True,
-        repositories=["org/repo1"],
-        users=["alice"],
-    )
-
     args = parse_arguments(["config.yaml", "--since", "invalid-date"])
 
-    with pytest.raises(ValueError, match="Invalid date format.*since"):
-        RunOptions.from_config_and_args(config, args)
+    with pytest.raises(ValueError, match=_SINCE_ERROR):
+        RunOptions.from_config_and_args(base_config, args)
 
 
-def test_invalid_date_format_until():
+def test_invalid_date_format_until(base_config):
     """Test that invalid --until date format raises error."""
-    config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
-        github_verify_ssl=True,
-        repositories=["org/repo1"],
-        users=["alice"],
+    args = parse_arguments(["config.yaml", "--until", "not-a-date"])
+
+    with pytest.raises(ValueError, match=_UNTIL_ERROR):
+        RunOptions.from_config_and_args(base_config, args)
+
+
+def test_invalid_calendar_date_raises_error(base_config):
+    """Test that a well-formed but impossible date is rejected."""
+    args = parse_arguments(["config.yaml", "--since", "2024-02-30"])
+
+    with pytest.raises(ValueError, match=_SINCE_ERROR):
+        RunOptions.from_config_and_args(base_config, args)
+
+
+def test_cli_datetime_accepts_iso_date_time_forms(base_config):
+    """Test that ISO dates with times and offsets are still accepted."""
+    args = parse_arguments(
+        [
+            "config.yaml",
+            "--since",
+            "2024-01-01T10:30",
+            "--until",
+            "2024-01-31 23:59:59.500+02:00",
+        ]
     )
+    options = RunOptions.from_config_and_args(base_config, args)
 
-    args = parse_arguments(["config.yaml", "--until", "not-a-date"])
+    assert options.since == datetime(2024, 1, 1, 10, 30, tzinfo=timezone.utc)
+    assert options.until == datetime(
+        2024, 1, 31, 21, 59, 59, 500000, tzinfo=timezone.utc
+    )
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 11),
+    reason="fromisoformat accepts hour-only times from Python 3.11",
+)
+def test_cli_datetime_accepts_hour_only_time(base_config):
+    """Test that an ISO date with an hour-only time is accepted."""
+    args = parse_arguments(["config.yaml", "--since", "2024-01-01T10"])
+    options = RunOptions.from_config_and_args(base_config, args)
+
+    assert options.since == datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+
+
+def test_cli_datetime_accepts_offset_with_seconds(base_config):
+    """Test that a UTC offset with a seconds component is accepted."""
+    args = parse_arguments(
+        ["config.yaml", "--until", "2024-01-01T10:00:00+05:30:00"]
+    )
+    options = RunOptions.from_config_and_args(base_config, args)
+
+    assert options.until == datetime(2024, 1, 1, 4, 30, tzinfo=timezone.utc)
+
+
+def test_cli_datetime_rejects_trailing_garbage(base_config):
+    """Test that values that are not purely ISO formatted are rejected."""
+    args = parse_arguments(["config.yaml", "--until", "2024-01-01 noon"])
 
-    with pytest.raises(ValueError, match="Invalid date format.*until"):
-        RunOptions.from_config_and_args(config, args)
+    with pytest.raises(ValueError, match=_UNTIL_ERROR):
+        RunOptions.from_config_and_args(base_config, args)
 
 
 def test_main_loads_config(tmp_path, monkeypatch, capsys):
@@ -303,7 +354,7 @@ def test_main_loads_config(tmp_path, monkeypatch, capsys):
 
     config_file = tmp_path / "test_config.yaml"
     with open(config_file, "w") as f:
-        yaml.dump(config_data, f)
+        yaml.dump(config_data, f, Dumper=_YAML_DUMPER)
 
     # Mock sys.argv
     monkeypatch.setattr(
@@ -322,7 +373,7 @@ def test_main_loads_config(tmp_path, monkeypatch, capsys):
     ) as mock_client_class:
         mock_client = MagicMock()
         mock_client_class.from_env.return_value = mock_client
-        mock_client.list_pull_requests.return_value = []
+        mock_client.iter_pull_request_pages.return_value = []
 
         # Mock environment variable
         monkeypatch.setenv("GITHUB_TOKEN", "fake_token")
@@ -336,6 +387,49 @@ def test_main_loads_config(tmp_path, monkeypatch, capsys):
     assert "Configuration loaded" in captured.out
 
 
+def test_main_warns_when_http_cache_cannot_be_saved(
+    tmp_path, monkeypatch, capsys
+):
+    """Test that a failing cache write does not abort a successful run."""
+    from unittest.mock import MagicMock, patch
+
+    config_data = {
+        "github": {"base_url": "https://github.mycompany.com/api/v3"},
+        "repositories": ["org1/repo1"],
+        "user_groups": {"team_alpha": ["a", "b", "c", "d", "e"]},
+    }
+    config_file = tmp_path / "test_config.yaml"
+    with open(config_file, "w") as f:
+        yaml.dump(config_data, f, Dumper=_YAML_DUMPER)
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "github_statistics",
+            str(config_file),
+            "--overwrite-data-protection",
+        ],
+    )
+
+    with patch(
+        "github_statistics.github_client.HttpGitHubClient"
+    ) as mock_client_class:
+        mock_client = MagicMock()
+        mock_client_class.from_env.return_value = mock_client
+        mock_client.iter_pull_request_pages.return_value = []
+        mock_client.save_cache.side_effect = OSError("disk full")
+        monkeypatch.setenv("GITHUB_TOKEN", "fake_token")
+
+        with patch("builtins.input", return_value="y"):
+            exit_code = main()
+
+    assert exit_code == 0
+    captured = capsys.readouterr()
+    assert "Failed to write HTTP cache: disk full" in captured.err
+    assert "Failed to collect pull requests" not in captured.err
+
+
 def test_main_with_cli_options(tmp_path, monkeypatch, capsys):
     """Test that main() handles CLI options correctly."""
     from unittest.mock import MagicMock, patch
@@ -352,7 +446,7 @@ def test_main_with_cli_options(tmp_path, monkeypatch, capsys):
 
     config_file = tmp_path / "test_config.yaml"
     with open(config_file, "w") as f:
-        yaml.dump(config_data, f)
+        yaml.dump(config_data, f, Dumper=_YAML_DUMPER)
 
     # Use custom output in tmp_path to avoid creating files in project root
     custom_output = str(tmp_path / "custom.md")
@@ -384,7 +478,7 @@ def test_main_with_cli_options(tmp_path, monkeypatch, capsys):
     ) as mock_client_class:
         mock_client = MagicMock()
         mock_client_class.from_env.return_value = mock_client
-        mock_client.list_pull_requests.return_value = []
+        mock_client.iter_pull_request_pages.return_value = []
 
         # Mock environment variable
         monkeypatch.setenv("GITHUB_TOKEN", "fake_token")
@@ -414,7 +508,7 @@ def test_main_prefers_api_token_over_env(tmp_path, monkeypatch):
 
     config_file = tmp_path / "test_config.yaml"
     with open(config_file, "w") as f:
-        yaml.dump(config_data, f)
+        yaml.dump(config_data, f, Dumper=_YAML_DUMPER)
 
     monkeypatch.setattr(
         sys,
@@ -431,7 +525,7 @@ def test_main_prefers_api_token_over_env(tmp_path, monkeypatch):
     ) as mock_client_class:
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
-        mock_client.list_pull_requests.return_value = []
+        mock_client.iter_pull_request_pages.return_value = []
 
         # Keep environment empty to ensure direct token path is used.
         monkeypatch.delenv("GITHUB_TOKEN", raising=False)
@@ -473,7 +567,7 @@ def test_main_invalid_date_exits_with_error(tmp_path, monkeypatch, capsys):
 
     config_file = tmp_path / "test_config.yaml"
     with open(config_file, "w") as f:
-        yaml.dump(config_data, f)
+        yaml.dump(config_data, f, Dumper=_YAML_DUMPER)
 
     monkeypatch.setattr(
         sys,
@@ -493,45 +587,29 @@ def test_main_invalid_date_exits_with_error(tmp_path, monkeypatch, capsys):
     assert "date" in captured.err.lower()
 
 
-def test_default_output_filename(tmp_path):
+def test_default_output_filename(tmp_path, base_config):
     """Test that default output filename is based on config filename."""
-    config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
-        github_verify_ssl=True,
-        repositories=["org/repo1"],
-        users=["alice"],
-    )
-
     # Test with simple filename - output is now absolute path, check basename
     args = parse_arguments(["my_config.yaml"])
-    options = RunOptions.from_config_and_args(config, args)
+    options = RunOptions.from_config_and_args(base_config, args)
     assert os.path.basename(options.output) == "my_config_statistics.md"
 
     # Test with path - output should be in same directory as input
     args = parse_arguments(["/path/to/project_config.yaml"])
-    options = RunOptions.from_config_and_args(config, args)
+    options = RunOptions.from_config_and_args(base_config, args)
     assert os.path.basename(options.output) == "project_config_statistics.md"
     assert os.path.dirname(options.output) == "/path/to"
 
     # Test with .yml extension
     args = parse_arguments(["config.yml"])
-    options = RunOptions.from_config_and_args(config, args)
+    options = RunOptions.from_config_and_args(base_config, args)
     assert os.path.basename(options.output) == "config_statistics.md"
 
 
-def test_run_options_dataclass():
+def test_run_options_dataclass(base_config):
     """Test that RunOptions can be instantiated directly."""
-    config = Config(
-        github_base_url="https://github.com/api/v3",
-        github_token_env="GITHUB_TOKEN",
-        github_verify_ssl=True,
-        repositories=["org/repo1"],
-        users=["alice"],
-    )
-
     options = RunOptions(
-        config=config,
+        config=base_config,
         since=datetime(2024, 1, 1, tzinfo=timezone.utc),
         until=datetime(2024, 12, 31, tzinfo=timezone.utc),
         repositories=["org/repo1"],
@@ -540,10 +618,46 @@ def test_run_options_dataclass():
         max_workers=8,
     )
 
-    assert options.config == config
+    assert options.config == base_config
     assert options.since == datetime(2024, 1, 1, tzinfo=timezone.utc)
     assert options.until == datetime(2024, 12, 31, tzinfo=timezone.utc)
     assert options.repositories == ["org/repo1"]
     assert options.users == ["alice"]
     assert options.output == "report.md"
     assert options.max_workers == 8
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+"
+)
+def test_run_options_uses_slots(base_config):
+    """Test that RunOptions instances are slotted on supported Pythons."""
+    config = dataclasses.replace(base_config, users=[])
+    options = RunOptions(
+        config=config,
+        since=None,
+        until=None,
+        repositories=["org/repo1"],
+        users=[],
+        output="report.md",
+        max_workers=4,
+    )
+
+    assert not hasattr(options, "__dict__")
+    options.data_protection_override_used = True
+    assert options.data_protection_override_used is True
+
+
+def test_cli_import_defers_heavy_dependencies():
+    """Test that importing the CLI module defers its heavy dependencies."""
+    code = (
+        "import sys\n"
+        "import github_statistics.cli\n"
+        "deferred = ('yaml', 'requests', 'argparse',\n"
+        "            'github_statistics.github_client',\n"
+        "            'github_statistics.report_md')\n"
+        "print([name for name in deferred if name in sys.modules])\n"
+    )
+    result = run_python(code)
+
+    assert result.stdout.strip() == "[]"
@@ -46,7 +46,7 @@ user_groups:
             mock_client_class.from_env.return_value = mock_client
 
             # Mock list_pull_requests to return test data
-            mock_client.list_pull_requests.return_value = [
+            pull_requests = [
                 {
                     "number": 1,
                     "title": "Test PR",
@@ -57,6 +57,7 @@ user_groups:
                     "merged_at": "2026-01-05T10:00:00Z",
                 }
             ]
+            mock_client.iter_pull_request_pages.return_value = [pull_requests]
 
             # Mock get_pull_request_details to return additions/deletions
             mock_client.get_pull_request_details.return_value = {
@@ -157,7 +158,7 @@ user_groups:
             mock_client_class.from_env.return_value = mock_client
 
             # Mock minimal PR data
-            mock_client.list_pull_requests.return_value = []
+            mock_client.iter_pull_request_pages.return_value = []
 
             with patch(
                 "sys.argv",
@@ -208,7 +209,7 @@ user_groups:
             mock_client = MagicMock()
             mock_client_class.return_value = mock_client
             mock_client_class.from_env.return_value = mock_client
-            mock_client.list_pull_requests.return_value = []
+            mock_client.iter_pull_request_pages.return_value = []
 
             with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}), patch(
                 "sys.argv",
@@ -271,7 +272,7 @@ user_groups:
             mock_client_class.from_env.return_value = mock_client
 
             # Mock PR data with reviews
-            mock_client.list_pull_requests.return_value = [
+            pull_requests = [
                 {
                     "number": 1,
                     "title": "Test PR 1",
@@ -291,6 +292,7 @@ user_groups:
                     "merged_at": None,
                 },
             ]
+            mock_client.iter_pull_request_pages.return_value = [pull_requests]
 
             # Mock get_pull_request_details to return additions/deletions
             def mock_details(owner, repo, number):
@@ -1,9 +1,11 @@
 """Tests for the collector module using FakeGitHubClient."""
 
+import sys
+import types
 from datetime import datetime, timezone
 
 from github_statistics.cli import RunOptions
-from github_statistics.collector import collect_prs
+from github_statistics.collector import collect_prs, iter_prs
 from github_statistics.config import Config
 from github_statistics.github_client import FakeGitHubClient
 
@@ -249,6 +251,36 @@ def test_collect_prs_with_reviews():
     assert pr.reviews[1].state == "CHANGES_REQUESTED"
 
 
+def test_collect_prs_interns_logins():
+    """Test that logins parsed from separate payloads share one object."""
+    login = "".join(["al", "ice"])  # built at runtime, so not interned
+    pr_data = {
+        "number": 1,
+        "title": "Self-reviewed",
+        "user": {"login": login},
+        "created_at": "2026-01-01T10:00:00Z",
+        "state": "open",
+        "additions": 5,
+        "deletions": 1,
+    }
+    reviews_data = [
+        {
+            "user": {"login": "".join(["ali", "ce"])},
+            "submitted_at": "2026-01-01T11:00:00Z",
+            "state": "COMMENTED",
+        }
+    ]
+    client = FakeGitHubClient(
+        pull_requests=[pr_data], reviews={1: reviews_data}
+    )
+    config, options = _single_repo_options()
+
+    pr = collect_prs(config, options, client)[0]
+
+    assert pr.author is pr.reviews[0].reviewer
+    assert pr.author is sys.intern("alice")
+
+
 def test_collect_prs_with_timeline_events():
     """Test collecting a PR with timeline events."""
     pr_data = {
@@ -690,3 +722,288 @@ def test_collect_prs_handles_no_prs_in_repository():
     prs = collect_prs(config, options, client)
 
     assert len(prs) == 0
+
+
+def test_collect_prs_with_multiple_workers_preserves_order():
+    """Test that concurrent PR assembly keeps the listing order."""
+    pr_list = [
+        {
+            "number": number,
+            "title": f"PR {number}",
+            "user": {"login": "alice"},
+            "created_at": "2026-01-01T10:00:00Z",
+            "state": "open",
+            "closed_at": None,
+            "merged_at": None,
+            "additions": number,
+            "deletions": 0,
+        }
+        for number in range(1, 21)
+    ]
+
+    client = FakeGitHubClient(pull_requests=pr_list)
+
+    config = Config(
+        github_base_url="https://api.github.com",
+        github_token_env="GITHUB_TOKEN",
+        github_verify_ssl=True,
+        repositories=["owner/repo"],
+        users=[],
+    )
+
+    options = RunOptions(
+        config=config,
+        since=None,
+        until=None,
+        repositories=["owner/repo"],
+        users=[],
+        output="output.md",
+        max_workers=4,
+    )
+
+    prs = collect_prs(config, options, client)
+
+    assert [pr.number for pr in prs] == list(range(1, 21))
+    assert [pr.additions for pr in prs] == list(range(1, 21))
+
+
+class _DetailsCountingClient(FakeGitHubClient):
+    """Fake client that records get_pull_request_details calls."""
+
+    def __init__(self, details, **kwargs):
+        super().__init__(**kwargs)
+        self.details = details
+        self.details_calls = []
+
+    def get_pull_request_details(self, _owner, _repo, number):
+        self.details_calls.append(number)
+        return self.details.get(number, {})
+
+
+def _single_repo_options():
+    config = Config(
+        github_base_url="https://api.github.com",
+        github_token_env="GITHUB_TOKEN",
+        github_verify_ssl=True,
+        repositories=["owner/repo"],
+        users=[],
+    )
+    options = RunOptions(
+        config=config,
+        since=None,
+        until=None,
+        repositories=["owner/repo"],
+        users=[],
+        output="output.md",
+        max_workers=1,
+    )
+    return config, options
+
+
+def test_collect_prs_skips_details_when_list_has_loc():
+    """Test that PR details are not fetched if additions are listed."""
+    pr_data = {
+        "number": 1,
+        "title": "Listed with LOC",
+        "user": {"login": "alice"},
+        "created_at": "2026-01-01T10:00:00Z",
+        "state": "open",
+        "additions": 7,
+        "deletions": 3,
+    }
+    client = _DetailsCountingClient(details={}, pull_requests=[pr_data])
+    config, options = _single_repo_options()
+
+    prs = collect_prs(config, options, client)
+
+    assert client.details_calls == []
+    assert prs[0].additions == 7
+    assert prs[0].deletions == 3
+
+
+def test_collect_prs_fetches_details_when_list_lacks_loc():
+    """Test that PR details are fetched if the listing omits LOC."""
+    pr_data = {
+        "number": 1,
+        "title": "Listed without LOC",
+        "user": {"login": "alice"},
+        "created_at": "2026-01-01T10:00:00Z",
+        "state": "open",
+    }
+    client = _DetailsCountingClient(
+        details={1: {"additions": 40, "deletions": 2}},
+        pull_requests=[pr_data],
+    )
+    config, options = _single_repo_options()
+
+    prs = collect_prs(config, options, client)
+
+    assert client.details_calls == [1]
+    assert prs[0].additions == 40
+    assert prs[0].deletions == 2
+
+
+def test_collect_prs_skips_team_review_requests():
+    """Test that review requests without a requested user are skipped."""
+    pr_data = {
+        "number": 1,
+        "title": "Add feature",
+        "user": {"login": "alice"},
+        "created_at": "2026-01-01T10:00:00Z",
+        "state": "open",
+        "additions": 50,
+        "deletions": 10,
+    }
+    timeline_data = [
+        {
+            "event": "review_requested",
+            "created_at": "2026-01-01T11:00:00Z",
+            "requested_team": {"slug": "reviewers"},
+        },
+        {
+            "event": "review_requested",
+            "created_at": "2026-01-01T11:30:00Z",
+            "requested_reviewer": None,
+        },
+        {
+            "event": "review_requested",
+            "created_at": "2026-01-01T12:00:00Z",
+            "requested_reviewer": {"login": "bob"},
+        },
+    ]
+    client = FakeGitHubClient(
+        pull_requests=[pr_data], timeline_events={1: timeline_data}
+    )
+    config, options = _single_repo_options()
+
+    prs = collect_prs(config, options, client)
+
+    assert [rr.requested_reviewer for rr in prs[0].review_requests] == ["bob"]
+
+
+def test_collect_prs_interleaves_issue_and_review_comments():
+    """Test that issue and review comments are sorted chronologically."""
+    pr_data = {
+        "number": 1,
+        "title": "Add feature",
+        "user": {"login": "alice"},
+        "created_at": "2026-01-01T10:00:00Z",
+        "state": "open",
+        "additions": 50,
+        "deletions": 10,
+    }
+
+    def _comment(body, created_at):
+        return {
+            "user": {"login": "bob"},
+            "created_at": created_at,
+            "body": body,
+        }
+
+    client = FakeGitHubClient(
+        pull_requests=[pr_data],
+        issue_comments={
+            1: [
+                _comment("issue-1", "2026-01-01T11:00:00Z"),
+                _comment("issue-2", "2026-01-01T14:00:00Z"),
+            ]
+        },
+        # Listed out of order: the result must not rely on endpoint order
+        review_comments={
+            1: [
+                _comment("review-3", "2026-01-01T15:00:00Z"),
+                _comment("review-1", "2026-01-01T12:00:00Z"),
+                _comment("review-2", "2026-01-01T13:00:00Z"),
+            ]
+        },
+    )
+    config, options = _single_repo_options()
+
+    prs = collect_prs(config, options, client)
+
+    assert [c.body for c in prs[0].comments] == [
+        "issue-1",
+        "review-1",
+        "review-2",
+        "issue-2",
+        "review-3",
+    ]
+
+
+def test_iter_prs_yields_pull_requests_lazily():
+    """Test that iter_prs streams the same PRs that collect_prs returns."""
+    pr_list = [
+        {
+            "number": number,
+            "title": f"PR {number}",
+            "user": {"login": "alice"},
+            "created_at": "2026-01-01T10:00:00Z",
+            "state": "open",
+            "additions": 1,
+            "deletions": 0,
+        }
+        for number in (1, 2, 3)
+    ]
+    client = FakeGitHubClient(pull_requests=pr_list)
+    config, options = _single_repo_options()
+
+    stream = iter_prs(options, client)
+
+    assert isinstance(stream, types.GeneratorType)
+    assert [pr.number for pr in stream] == [1, 2, 3]
+    assert [pr.number for pr in collect_prs(config, options, client)] == [
+        1,
+        2,
+        3,
+    ]
+
+
+def test_iter_prs_bounds_in_flight_assemblies():
+    """Test that iter_prs submits at most 2 * max_workers PRs ahead."""
+    pr_list = [
+        {
+            "number": number,
+            "title": f"PR {number}",
+            "user": {"login": "alice"},
+            "created_at": "2026-01-01T10:00:00Z",
+            "state": "open",
+        }
+        for number in range(1, 11)
+    ]
+    client = _DetailsCountingClient(details={}, pull_requests=pr_list)
+    _config, options = _single_repo_options()
+
+    stream = iter_prs(options, client)
+    first = next(stream)
+
+    assert first.number == 1
+    assert len(client.details_calls) <= 2 * options.max_workers
+    assert [pr.number for pr in stream] == list(range(2, 11))
+    assert sorted(client.details_calls) == list(range(1, 11))
+
+
+def test_collect_prs_skips_detail_requests_for_excluded_prs():
+    """Test that PRs outside the date range trigger no detail requests."""
+    pr_list = [
+        {
+            "number": number,
+            "title": f"PR {number}",
+            "user": {"login": "alice"},
+            "created_at": created_at,
+            "state": "open",
+        }
+        for number, created_at in (
+            (1, "2025-12-01T10:00:00Z"),
+            (2, "2026-01-15T10:00:00Z"),
+            (3, "2026-03-01T10:00:00Z"),
+        )
+    ]
+    client = _DetailsCountingClient(details={}, pull_requests=pr_list)
+    config, options = _single_repo_options()
+    options.since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    options.until = datetime(2026, 1, 31, tzinfo=timezone.utc)
+
+    prs = collect_prs(config, options, client)
+
+    assert [pr.number for pr in prs] == [2]
+    assert client.details_calls == [2]
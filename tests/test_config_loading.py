@@ -1,12 +1,21 @@
 """Tests for configuration loading and validation."""
 
+import dataclasses
 import os
+import sys
 import tempfile
 
 import pytest
 import yaml
 
-from github_statistics.config import Config, ConfigValidationError, load_config
+from github_statistics.config import (
+    Config,
+    ConfigValidationError,
+    load_config,
+    normalize_repository,
+    validate_config,
+)
+from tests.helpers import run_python
 
 
 def _valid_groups():
@@ -106,6 +115,16 @@ def test_normalize_repository_formats():
         os.unlink(config_path)
 
 
+def test_normalize_repository_prefix_variants():
+    """Test that each URL prefix reaches its pattern and others pass through."""
+    assert normalize_repository("http://ghe.local/org/repo.git") == "org/repo"
+    assert normalize_repository("https://github.com/org/repo") == "org/repo"
+    assert normalize_repository("git@github.com:org/repo") == "org/repo"
+    assert normalize_repository("org/repo/") == "org/repo"
+    assert normalize_repository("git@no-colon") == "git@no-colon"
+    assert normalize_repository("https://github.com/") == "https://github.com"
+
+
 def test_missing_user_groups_raises_error():
     """Test that missing user_groups fails validation."""
     config_data = {
@@ -170,6 +189,29 @@ def test_group_with_duplicate_members_fails():
         os.unlink(config_path)
 
 
+def test_group_with_non_string_member_fails():
+    """Test that nested or empty members are reported as invalid names."""
+    config_data = {
+        "github": {"base_url": "https://api.github.com"},
+        "repositories": ["org/repo"],
+        "user_groups": {
+            "team_alpha": ["alice", "bob", ["carol"], "dave", "erin"],
+        },
+    }
+
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".yaml", delete=False
+    ) as f:
+        yaml.dump(config_data, f)
+        config_path = f.name
+
+    try:
+        with pytest.raises(ConfigValidationError, match="invalid member"):
+            load_config(config_path)
+    finally:
+        os.unlink(config_path)
+
+
 def test_empty_group_name_fails():
     """Test that empty group names are rejected."""
     config_data = {
@@ -271,6 +313,48 @@ def test_config_dataclass_instantiation():
     assert config.github_api_token == "direct-token"
     assert config.github_token_env == "TOKEN"
     assert config.user_groups == _valid_groups()
+    # Frozen, so shared instances cannot be altered
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.repositories = []  # type: ignore[misc]
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+"
+)
+def test_config_uses_slots():
+    """Test that Config instances are slotted on supported Pythons."""
+    config = Config(
+        github_base_url="https://api.github.com",
+        github_verify_ssl=True,
+        repositories=["owner/repo"],
+        users=[],
+    )
+
+    assert not hasattr(config, "__dict__")
+    assert config.user_groups == {}
+
+
+def test_validate_config_accepts_parsed_mapping():
+    """Test that an in-memory mapping is validated like a loaded file."""
+    config = validate_config(
+        {
+            "github": {"base_url": "https://api.github.com"},
+            "repositories": ["https://github.com/org/repo.git"],
+            "user_groups": _valid_groups(),
+        }
+    )
+
+    assert config.repositories == ["org/repo"]
+    assert config.user_groups == _valid_groups()
+
+
+def test_validate_config_rejects_missing_sections():
+    """Test that validate_config raises the same errors as load_config."""
+    with pytest.raises(ConfigValidationError, match="github"):
+        validate_config({"repositories": ["org/repo"]})
+
+    with pytest.raises(ConfigValidationError, match="dictionary"):
+        validate_config(["not", "a", "mapping"])
 
 
 def test_file_not_found():
@@ -292,3 +376,45 @@ def test_invalid_yaml():
             load_config(config_path)
     finally:
         os.unlink(config_path)
+
+
+def test_load_config_rereads_same_size_edits():
+    """Test that an edit keeping size and mtime is still picked up."""
+    config_data = {
+        "github": {"base_url": "https://api.github.com"},
+        "repositories": ["owner/repo"],
+        "user_groups": _valid_groups(),
+    }
+
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".yaml", delete=False
+    ) as f:
+        yaml.dump(config_data, f)
+        config_path = f.name
+
+    try:
+        first = load_config(config_path)
+        stat = os.stat(config_path)
+
+        config_data["repositories"] = ["owner/repx"]
+        with open(config_path, "w") as f:
+            yaml.dump(config_data, f)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert os.stat(config_path).st_size == stat.st_size
+        assert first.repositories == ["owner/repo"]
+        assert load_config(config_path).repositories == ["owner/repx"]
+    finally:
+        os.unlink(config_path)
+
+
+def test_config_import_does_not_load_yaml():
+    """Test that PyYAML is only imported once a file is loaded."""
+    code = (
+        "import sys\n"
+        "import github_statistics.config\n"
+        "print('yaml' in sys.modules)\n"
+    )
+    result = run_python(code)
+
+    assert result.stdout.strip() == "False"
@@ -71,6 +71,39 @@ def test_active_user_boundary_timestamps_are_inclusive():
     assert active_users == {"alice", "bob"}
 
 
+def test_active_user_open_ended_period():
+    pr = _make_pr_with_commits(
+        "org/repo",
+        [
+            ("alice", datetime(2020, 1, 1, tzinfo=timezone.utc)),
+            ("bob", datetime(2030, 1, 1, tzinfo=timezone.utc)),
+        ],
+    )
+    boundary = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    assert get_active_users_in_period([pr], since=None, until=None) == {
+        "alice",
+        "bob",
+    }
+    assert get_active_users_in_period([pr], since=boundary, until=None) == {
+        "bob"
+    }
+    assert get_active_users_in_period([pr], since=None, until=boundary) == {
+        "alice"
+    }
+
+
+def test_active_user_open_ended_period_with_naive_commit_times():
+    pr = _make_pr_with_commits(
+        "org/repo",
+        [("alice", datetime(2026, 1, 10))],
+    )
+
+    assert get_active_users_in_period([pr], since=None, until=None) == {
+        "alice"
+    }
+
+
 def test_compute_active_group_counts():
     active_users = {"alice", "bob", "carol"}
     groups = {
@@ -155,7 +188,7 @@ def test_cli_violation_without_override_fails(tmp_path, monkeypatch, capsys):
     ) as mock_client_class:
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
-        mock_client.list_pull_requests.return_value = []
+        mock_client.iter_pull_request_pages.return_value = []
         exit_code = main()
 
     assert exit_code != 0
@@ -192,7 +225,7 @@ def test_cli_violation_with_override_but_not_confirmed_fails(
     ) as mock_client_class:
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
-        mock_client.list_pull_requests.return_value = []
+        mock_client.iter_pull_request_pages.return_value = []
         exit_code = main()
 
     assert exit_code != 0
@@ -227,7 +260,7 @@ def test_cli_violation_with_override_and_confirmed_y_proceeds(
     ) as mock_client_class:
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
-        mock_client.list_pull_requests.return_value = []
+        mock_client.iter_pull_request_pages.return_value = []
         exit_code = main()
 
     assert exit_code == 0
@@ -2,10 +2,15 @@
 Tests for HTTP GitHub client implementation with mocked responses.
 """
 
+import json
 import os
+import stat
+from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 import responses
+from responses import matchers
 
 from github_statistics.github_client import HttpGitHubClient
 
@@ -132,6 +137,49 @@ def test_http_client_pagination():
     assert len(responses.calls) == 2
 
 
+@responses.activate
+def test_http_client_fetches_remaining_pages_from_last_link():
+    """Test that pages up to rel="last" are all fetched and kept in order."""
+    url = "https://api.github.com/repos/owner/repo/pulls/1/commits"
+    responses.add(
+        responses.GET,
+        url,
+        match=[
+            matchers.query_param_matcher({"per_page": "100"}),
+        ],
+        json=[{"sha": "a"}],
+        status=200,
+        headers={
+            "Link": (
+                f'<{url}?per_page=100&page=2>; rel="next", '
+                f'<{url}?per_page=100&page=4>; rel="last"'
+            )
+        },
+    )
+    for page, sha in [("2", "b"), ("3", "c"), ("4", "d")]:
+        responses.add(
+            responses.GET,
+            url,
+            match=[
+                matchers.query_param_matcher(
+                    {"per_page": "100", "page": page}
+                ),
+            ],
+            json=[{"sha": sha}],
+            status=200,
+        )
+
+    client = HttpGitHubClient(
+        base_url="https://api.github.com",
+        token="test-token",
+    )
+
+    commits = client.get_pull_request_commits("owner", "repo", 1)
+
+    assert [commit["sha"] for commit in commits] == ["a", "b", "c", "d"]
+    assert len(responses.calls) == 4
+
+
 @responses.activate
 def test_http_client_get_pull_request_details():
     """Test fetching PR details."""
@@ -574,3 +622,251 @@ def test_http_client_accepts_correct_base_urls():
         verify_ssl=True,
     )
     assert client2.base_url == "https://github.mycompany.com/api/v3"
+
+
+def test_http_client_widens_pool_size_but_keeps_host_pools():
+    """Test that the adapter raises pool_maxsize only."""
+    with patch("github_statistics.github_client.HTTPAdapter") as adapter_class:
+        HttpGitHubClient(
+            base_url="https://api.github.com",
+            token="test-token",
+        )
+
+    adapter_class.assert_called_once_with(pool_maxsize=32)
+
+
+@responses.activate
+def test_http_client_cache_replays_not_modified_responses(tmp_path):
+    """Test that cached ETags are revalidated and 304s served from cache."""
+    cache_path = tmp_path / "http_cache.json"
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/owner/repo/pulls/42/commits",
+        json=[{"sha": "abc123"}],
+        status=200,
+        headers={"ETag": '"v1"'},
+    )
+
+    first_client = HttpGitHubClient(
+        base_url="https://api.github.com",
+        token="test-token",
+        cache_path=str(cache_path),
+    )
+    assert first_client.get_pull_request_commits("owner", "repo", 42) == [
+        {"sha": "abc123"}
+    ]
+    first_client.save_cache()
+    assert cache_path.exists()
+
+    responses.replace(
+        responses.GET,
+        "https://api.github.com/repos/owner/repo/pulls/42/commits",
+        status=304,
+    )
+
+    second_client = HttpGitHubClient(
+        base_url="https://api.github.com",
+        token="test-token",
+        cache_path=str(cache_path),
+    )
+    commits = second_client.get_pull_request_commits("owner", "repo", 42)
+
+    assert commits == [{"sha": "abc123"}]
+    assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+@responses.activate
+def test_http_client_cache_drops_entries_not_requested(tmp_path):
+    """Test that saving keeps only entries for URLs requested this run."""
+    cache_path = tmp_path / "http_cache.json"
+    repo_url = "https://api.github.com/repos/owner/repo"
+    commits_url = f"{repo_url}/pulls/42/commits?per_page=100"
+    stale_url = f"{repo_url}/pulls/7/commits?per_page=100"
+    cache_path.write_text(
+        json.dumps(
+            {
+                stale_url: {"etag": '"old"', "link": "", "data": []},
+                commits_url: {"etag": '"v1"', "link": "", "data": []},
+            }
+        )
+    )
+    responses.add(responses.GET, commits_url, status=304)
+
+    client = HttpGitHubClient(
+        base_url="https://api.github.com",
+        token="test-token",
+        cache_path=str(cache_path),
+    )
+    client.get_pull_request_commits("owner", "repo", 42)
+    client.save_cache()
+
+    assert list(json.loads(cache_path.read_text())) == [commits_url]
+
+
+@pytest.mark.skipif(
+    os.name != "posix", reason="file modes are only enforced on POSIX"
+)
+@responses.activate
+def test_http_client_cache_file_is_private(tmp_path):
+    """Test that the saved cache is owner-only and leaves no temp file."""
+    cache_path = tmp_path / "http_cache.json"
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/owner/repo/pulls/42/commits",
+        json=[],
+        status=200,
+        headers={"ETag": '"v1"'},
+    )
+
+    client = HttpGitHubClient(
+        base_url="https://api.github.com",
+        token="test-token",
+        cache_path=str(cache_path),
+    )
+    client.get_pull_request_commits("owner", "repo", 42)
+    client.save_cache()
+
+    assert stat.S_IMODE(cache_path.stat().st_mode) == 0o600
+    assert list(tmp_path.iterdir()) == [cache_path]
+
+
+def test_http_client_cache_skips_malformed_entries(tmp_path):
+    """Test that cache entries of the wrong shape are ignored on load."""
+    repo_url = "https://api.github.com/repos/owner/repo"
+    valid_url = f"{repo_url}/pulls/1/commits?per_page=100"
+    cache_path = tmp_path / "http_cache.json"
+    cache_path.write_text(
+        json.dumps(
+            {
+                valid_url: {"etag": '"v1"', "link": "", "data": []},
+                f"{repo_url}/pulls/2/commits": ["not", "a", "dict"],
+                f"{repo_url}/pulls/3/commits": {"etag": '"v1"'},
+                f"{repo_url}/pulls/4/commits": {"etag": 1, "data": []},
+                f"{repo_url}/pulls/5/commits": {"data": []},
+            }
+        )
+    )
+
+    client = HttpGitHubClient(
+        base_url="https://api.github.com",
+        token="test-token",
+        cache_path=str(cache_path),
+    )
+
+    assert list(client._response_cache) == [valid_url]
+
+
+@responses.activate
+def test_http_client_without_cache_sends_no_validators(tmp_path):
+    """Test that conditional headers are only sent with a cache."""
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/owner/repo/pulls/42/commits",
+        json=[],
+        status=200,
+        headers={"ETag": '"v1"'},
+    )
+
+    client = HttpGitHubClient(
+        base_url="https://api.github.com",
+        token="test-token",
+    )
+    client.get_pull_request_commits("owner", "repo", 42)
+    client.get_pull_request_commits("owner", "repo", 42)
+    client.save_cache()
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+@responses.activate
+def test_http_client_iter_pull_request_pages_yields_each_page():
+    """Test that pull requests are yielded page by page with filtering."""
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/owner/repo/pulls",
+        json=[
+            {"number": 3, "created_at": "2024-02-01T10:00:00Z"},
+            {"number": 2, "created_at": "2024-01-20T10:00:00Z"},
+        ],
+        status=200,
+        headers={
+            "Link": '<https://api.github.com/repos/owner/repo/pulls?page=2>; rel="next"'
+        },
+    )
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/owner/repo/pulls",
+        json=[
+            {"number": 1, "created_at": "2024-01-10T10:00:00Z"},
+            {"number": 0, "created_at": "2023-12-01T10:00:00Z"},
+        ],
+        status=200,
+    )
+
+    client = HttpGitHubClient(
+        base_url="https://api.github.com",
+        token="test-token",
+    )
+
+    pages = client.iter_pull_request_pages(
+        "owner", "repo", since=datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+
+    first_page = next(pages)
+    assert [pr["number"] for pr in first_page] == [3, 2]
+    assert len(responses.calls) == 1
+    assert [[pr["number"] for pr in page] for page in pages] == [[1]]
+    assert len(responses.calls) == 2
+
+
+def test_http_client_date_filter_rejects_naive_bounds():
+    """Test that naive bounds are rejected rather than read as local time."""
+    prs = [{"number": 1, "created_at": "2024-01-15T10:00:00Z"}]
+
+    with pytest.raises(TypeError, match="timezone-aware"):
+        HttpGitHubClient._filter_by_created_at(
+            prs, since=None, until=datetime(2024, 1, 31)
+        )
+
+
+def test_http_client_date_filter_rejects_naive_created_at():
+    """Test that created_at without an offset is not read as local time."""
+    prs = [{"number": 1, "created_at": "2024-01-15T10:00:00"}]
+
+    with pytest.raises(TypeError, match="UTC offset"):
+        HttpGitHubClient._filter_by_created_at(
+            prs, since=datetime(2024, 1, 1, tzinfo=timezone.utc), until=None
+        )
+
+
+@responses.activate
+def test_http_client_stops_listing_at_pages_older_than_since():
+    """Test that newest-first listing stops once PRs predate since."""
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/owner/repo/pulls",
+        json=[
+            {"number": 2, "created_at": "2024-01-10T10:00:00Z"},
+            {"number": 1, "created_at": "2023-12-01T10:00:00Z"},
+        ],
+        status=200,
+        headers={
+            "Link": '<https://api.github.com/repos/owner/repo/pulls?page=2>; rel="next"'
+        },
+    )
+
+    client = HttpGitHubClient(
+        base_url="https://api.github.com",
+        token="test-token",
+    )
+
+    prs = client.list_pull_requests(
+        "owner", "repo", since=datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+
+    assert [pr["number"] for pr in prs] == [2]
+    assert len(responses.calls) == 1
+    request_url = responses.calls[0].request.url
+    assert "sort=created" in request_url
+    assert "direction=desc" in request_url
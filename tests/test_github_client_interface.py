@@ -4,6 +4,8 @@ Tests for GitHub client interface (no real network calls).
 
 from datetime import datetime, timezone
 
+import pytest
+
 from github_statistics.github_client import FakeGitHubClient, GitHubClient
 
 
@@ -34,6 +36,19 @@ def test_list_pull_requests_with_date_filters():
     assert isinstance(prs, list)
 
 
+def test_iter_pull_request_pages_defaults_to_single_page():
+    """Test that clients without pagination yield one page."""
+    test_prs = [
+        {"number": 1, "created_at": "2024-01-01T10:00:00Z"},
+        {"number": 2, "created_at": "2024-01-02T10:00:00Z"},
+    ]
+    client = FakeGitHubClient(pull_requests=test_prs)
+
+    pages = list(client.iter_pull_request_pages("owner", "repo"))
+
+    assert pages == [test_prs]
+
+
 def test_get_pull_request_details():
     """Test get_pull_request_details returns PR details dict."""
     test_prs = [
@@ -284,6 +299,66 @@ def test_fake_client_since_and_until_filtering():
     assert filtered_prs[0]["number"] == 2
 
 
+def test_fake_client_rejects_naive_date_bounds():
+    """Test that naive bounds are rejected rather than read as local time."""
+    client = FakeGitHubClient(
+        pull_requests=[{"number": 1, "created_at": "2024-01-15T10:00:00Z"}]
+    )
+
+    with pytest.raises(TypeError, match="timezone-aware"):
+        client.list_pull_requests("owner", "repo", since=datetime(2024, 1, 1))
+
+
+def test_fake_client_parses_created_at_only_when_filtering():
+    """Test that bad timestamps only fail date-filtered queries."""
+    client = FakeGitHubClient(
+        pull_requests=[{"number": 1, "created_at": "not-a-timestamp"}]
+    )
+
+    assert client.list_pull_requests("owner", "repo") == [
+        {"number": 1, "created_at": "not-a-timestamp"}
+    ]
+    with pytest.raises(ValueError):
+        client.list_pull_requests(
+            "owner", "repo", since=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+
+
+def test_fake_client_date_window_keeps_listing_order():
+    """Test that filtered PRs keep listing order and inclusive bounds."""
+    test_prs = [
+        {"number": 1, "created_at": "2024-01-20T10:00:00Z"},
+        {"number": 2, "created_at": "2024-01-01T00:00:00Z"},
+        {"number": 3, "created_at": "2023-12-31T23:59:59Z"},
+        {"number": 4},
+        {"number": 5, "created_at": "2024-01-10T10:00:00Z"},
+        {"number": 6, "created_at": "2024-01-31T00:00:00Z"},
+    ]
+
+    client = FakeGitHubClient(pull_requests=test_prs)
+
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    until = datetime(2024, 1, 31, tzinfo=timezone.utc)
+    filtered_prs = client.list_pull_requests(
+        "owner", "repo", since=since, until=until
+    )
+
+    assert [pr["number"] for pr in filtered_prs] == [1, 2, 5, 6]
+
+
+def test_fake_client_window_covering_all_prs_returns_list_itself():
+    """Test that a date window excluding nothing returns the PR list."""
+    test_prs = [
+        {"number": 1, "created_at": "2024-01-20T10:00:00Z"},
+        {"number": 2, "created_at": "2024-01-01T00:00:00Z"},
+    ]
+
+    client = FakeGitHubClient(pull_requests=test_prs)
+
+    since = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    assert client.list_pull_requests("owner", "repo", since=since) is test_prs
+
+
 def test_fake_client_supports_multiple_repos():
     """Test that FakeGitHubClient can handle different repos."""
     client = FakeGitHubClient()
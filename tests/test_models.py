@@ -2,8 +2,11 @@
 Tests for data models (PRs, reviews, events, commits, comments).
 """
 
+import sys
 from datetime import datetime, timezone
 
+import pytest
+
 from github_statistics.models import (
     CommentInfo,
     CommitInfo,
@@ -453,3 +456,32 @@ def test_review_states():
             state=state,
         )
         assert review.state == state
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+"
+)
+def test_models_use_slots():
+    """Test that model instances are slotted on supported Pythons."""
+    created_at = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+    instances = [
+        CommitInfo(
+            sha="abc", author="dev", committed_at=created_at, message="m"
+        ),
+        CommentInfo(author="dev", created_at=created_at, body="b"),
+        ReviewEvent(reviewer="rev", submitted_at=created_at, state="APPROVED"),
+        ReviewRequestEvent(requested_reviewer="rev", requested_at=created_at),
+        ReadyForReviewEvent(ready_at=created_at),
+        PullRequest(
+            number=1,
+            title="Test",
+            author="dev",
+            created_at=created_at,
+            state="open",
+            additions=1,
+            deletions=0,
+        ),
+    ]
+
+    for instance in instances:
+        assert not hasattr(instance, "__dict__")
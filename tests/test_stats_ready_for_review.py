@@ -489,3 +489,69 @@ def test_classify_commits_changes_requested_without_subsequent_commits():
     # Commit before CHANGES_REQUESTED = unrequested
     assert requested == 0
     assert unrequested == 1
+
+
+def test_classify_commits_overlapping_and_touching_cycles():
+    """Test that overlapping cycles merge and a shared endpoint is outside."""
+    ready_time = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+    pr = PullRequest(
+        number=1,
+        title="PR with overlapping cycles",
+        author="alice",
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        state="open",
+        additions=10,
+        deletions=5,
+        commits=[
+            CommitInfo(
+                sha=f"commit{day}",
+                author="alice",
+                committed_at=datetime(2026, 1, day, tzinfo=timezone.utc),
+                message=f"Commit on day {day}",
+            )
+            # Listed out of order to exercise the sort before the sweep
+            for day in (15, 8, 12, 11, 13)
+        ],
+        reviews=[
+            # bob's cycle (7, 10) overlaps carol's cycle (9, 12)
+            ReviewEvent(
+                reviewer="bob",
+                submitted_at=datetime(2026, 1, 7, tzinfo=timezone.utc),
+                state="CHANGES_REQUESTED",
+            ),
+            ReviewEvent(
+                reviewer="carol",
+                submitted_at=datetime(2026, 1, 9, tzinfo=timezone.utc),
+                state="CHANGES_REQUESTED",
+            ),
+            # dave's cycle (12, 14) only touches carol's cycle
+            ReviewEvent(
+                reviewer="dave",
+                submitted_at=datetime(2026, 1, 12, tzinfo=timezone.utc),
+                state="CHANGES_REQUESTED",
+            ),
+            ReviewEvent(
+                reviewer="dave",
+                submitted_at=datetime(2026, 1, 14, tzinfo=timezone.utc),
+                state="APPROVED",
+            ),
+        ],
+        review_requests=[
+            ReviewRequestEvent(
+                requested_reviewer="bob",
+                requested_at=datetime(2026, 1, 10, tzinfo=timezone.utc),
+            ),
+            ReviewRequestEvent(
+                requested_reviewer="carol",
+                requested_at=datetime(2026, 1, 12, tzinfo=timezone.utc),
+            ),
+        ],
+        ready_for_review_at=ReadyForReviewEvent(ready_at=ready_time),
+    )
+
+    requested, unrequested = classify_commits_requested_vs_unrequested(pr)
+
+    # Requested: days 8, 11, 13; unrequested: day 12 (boundary) and day 15
+    assert requested == 3
+    assert unrequested == 2
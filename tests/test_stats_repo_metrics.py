@@ -1,7 +1,10 @@
 """Tests for repository-level statistics computation."""
 
+import dataclasses
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from github_statistics.models import (
     CommentInfo,
     CommitInfo,
@@ -9,7 +12,11 @@ from github_statistics.models import (
     ReviewEvent,
     ReviewRequestEvent,
 )
-from github_statistics.stats import Distribution, compute_repository_stats
+from github_statistics.stats import (
+    Distribution,
+    _compute_distribution,
+    compute_repository_stats,
+)
 
 
 def test_distribution_dataclass():
@@ -35,6 +42,27 @@ def test_distribution_single_value():
     assert dist.minimum == dist.maximum == dist.mean == dist.median == 5.0
 
 
+def test_compute_distribution_odd_and_even_counts():
+    """Test that unsorted input yields the same values as statistics."""
+    odd = _compute_distribution([7.0, 1.0, 4.0])
+    assert (odd.count, odd.minimum, odd.maximum) == (3, 1.0, 7.0)
+    assert odd.median == 4.0
+    assert odd.mean == 4.0
+
+    even = _compute_distribution([10.0, 2.0, 4.0, 8.0])
+    assert (even.minimum, even.maximum) == (2.0, 10.0)
+    assert even.median == 6.0
+    assert even.mean == 6.0
+
+    empty = _compute_distribution([])
+    assert empty.count == 0
+    assert empty.median == 0.0
+    # Empty metrics share one immutable instance
+    assert _compute_distribution([]) is empty
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        empty.count = 1  # type: ignore[misc]
+
+
 def test_open_pr_duration():
     """Test duration calculation for open PRs."""
     now = datetime(2026, 2, 14, 12, 0, 0, tzinfo=timezone.utc)
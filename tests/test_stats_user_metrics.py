@@ -8,7 +8,10 @@ from github_statistics.models import (
     ReviewEvent,
     ReviewRequestEvent,
 )
-from github_statistics.stats import compute_user_stats
+from github_statistics.stats import (
+    compute_group_stats,
+    compute_user_stats,
+)
 
 
 def test_user_stats_time_to_submit_review():
@@ -47,6 +50,64 @@ def test_user_stats_time_to_submit_review():
     assert abs(user_stats["bob"].time_to_submit_review.minimum - 4.0) < 0.01
 
 
+def test_user_stats_pairs_requests_with_first_later_review():
+    """Test that each request pairs with the reviewer's next review only."""
+    pr = PullRequest(
+        number=1,
+        title="PR reviewed twice",
+        author="alice",
+        created_at=datetime(2026, 1, 1, 9, 0, 0, tzinfo=timezone.utc),
+        state="open",
+        additions=10,
+        deletions=5,
+        review_requests=[
+            ReviewRequestEvent(
+                requested_reviewer="bob",
+                requested_at=datetime(
+                    2026, 1, 1, 10, 0, 0, tzinfo=timezone.utc
+                ),
+            ),
+            ReviewRequestEvent(
+                requested_reviewer="bob",
+                requested_at=datetime(
+                    2026, 1, 1, 15, 0, 0, tzinfo=timezone.utc
+                ),
+            ),
+        ],
+        # Listed out of order; carol's review must not match bob's requests
+        reviews=[
+            ReviewEvent(
+                reviewer="bob",
+                submitted_at=datetime(
+                    2026, 1, 1, 16, 0, 0, tzinfo=timezone.utc
+                ),
+                state="APPROVED",
+            ),
+            ReviewEvent(
+                reviewer="carol",
+                submitted_at=datetime(
+                    2026, 1, 1, 11, 0, 0, tzinfo=timezone.utc
+                ),
+                state="COMMENTED",
+            ),
+            ReviewEvent(
+                reviewer="bob",
+                submitted_at=datetime(
+                    2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc
+                ),
+                state="CHANGES_REQUESTED",
+            ),
+        ],
+    )
+
+    user_stats = compute_user_stats([pr])
+
+    review_times = user_stats["bob"].time_to_submit_review
+    assert review_times.count == 2
+    assert review_times.minimum == 1.0
+    assert review_times.maximum == 2.0
+
+
 def test_user_stats_request_for_changes_rate():
     """Test request-for-changes rate calculation."""
     prs = [
@@ -402,3 +463,29 @@ def test_user_stats_re_requested_review():
     assert user_stats["bob"].time_to_submit_review.count == 2
     assert user_stats["bob"].time_to_submit_review.minimum == 2.0
     assert user_stats["bob"].time_to_submit_review.maximum == 4.0
+
+
+def test_group_stats_for_group_without_activity():
+    """Test that groups without recorded activity get empty statistics."""
+    pr = PullRequest(
+        number=1,
+        title="Alice's PR",
+        author="alice",
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        state="open",
+        additions=10,
+        deletions=5,
+    )
+    groups = {"idle": ["frank", "grace", "heidi", "ivan", "judy"]}
+
+    group_stats = compute_group_stats(
+        [pr], groups, active_group_counts={"idle": 2}
+    )
+
+    idle = group_stats["idle"]
+    assert idle.member_count == 5
+    assert idle.active_member_count == 2
+    assert idle.changes_requested_rate == 0.0
+    assert idle.direct_approval_rate == 0.0
+    assert idle.loc_per_created_pr.count == 0
+    assert idle.time_to_submit_review.count == 0
@@ -69,7 +69,7 @@ def test_main_with_verbose_passes_request_log_path(tmp_path, monkeypatch):
     ) as mock_client_class:
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
-        mock_client.list_pull_requests.return_value = []
+        mock_client.iter_pull_request_pages.return_value = []
 
         with patch("builtins.input", return_value="y"):
             exit_code = main()